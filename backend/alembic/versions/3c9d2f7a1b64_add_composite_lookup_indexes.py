@@ -0,0 +1,41 @@
+"""add_composite_lookup_indexes
+
+Revision ID: 3c9d2f7a1b64
+Revises: e74120476dcd
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d2f7a1b64'
+down_revision: Union[str, Sequence[str], None] = 'e74120476dcd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_games_state_last_activity', 'games', ['state', 'last_activity_at'], unique=False)
+    op.create_index('ix_snap_game_created', 'game_state_snapshots', ['game_id', 'created_at'], unique=False)
+
+    # round_history is created by init_db() rather than a migration, so it may not exist yet
+    if sa.inspect(op.get_bind()).has_table('round_history'):
+        # Concurrent saves could insert the same round twice; keep the first copy
+        op.execute(
+            "DELETE FROM round_history WHERE id NOT IN "
+            "(SELECT MIN(id) FROM round_history GROUP BY game_id, round_number)"
+        )
+        op.create_index('ix_round_game_num', 'round_history', ['game_id', 'round_number'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if sa.inspect(op.get_bind()).has_table('round_history'):
+        op.drop_index('ix_round_game_num', table_name='round_history')
+    op.drop_index('ix_snap_game_created', table_name='game_state_snapshots')
+    op.drop_index('ix_games_state_last_activity', table_name='games')
@@ -452,8 +452,7 @@ async def list_game_history(
             history_items = []
             for game in games:
                 # Get player names
-                players = await player_repo.get_players_for_game(game.id)
-                player_names = [p.name for p in players]
+                player_names = await player_repo.get_player_names(game.id)
 
                 # Get round count
                 rounds_count = await round_repo.get_round_count(game.id)
@@ -2,6 +2,9 @@
 Broadcasting utilities for sending game state updates to all connected clients.
 """
 
+import json
+from typing import Dict, Optional
+
 from app.api.v1.connection_manager import connection_manager
 from app.core.game_server import get_game_server
 from app.logging_config import get_logger
@@ -16,24 +19,24 @@ async def broadcast_state(game_id: str):
     Sends per-socket owner_hand if the socket has identified with a seat.
     Handles disconnected sockets gracefully by removing them from the connection pool.
 
-    Performance optimization: Pre-serializes all player hands once to avoid
-    redundant serialization for each connection.
+    Performance optimization: Each distinct message (one per seat, plus one
+    for unidentified sockets) is JSON-encoded once and the text is reused for
+    every connection that shares it.
     """
     server = get_game_server()
     sess = server.get_session(game_id)
     if not sess:
         return
 
-    base = sess.get_public_state().model_dump()
-
     # Get all connections for this game
     connections = connection_manager.get_game_connections(game_id)
     if not connections:
         return
 
-    # Performance optimization: Pre-serialize all hands once
-    # This avoids calling get_hand_for() N times (once per connection)
-    hands_cache = {seat: sess.get_hand_for(seat) for seat in range(sess.seats)}
+    base = sess.get_public_state_dict()
+
+    # Encoded messages keyed by seat (None for sockets without a seat)
+    messages: Dict[Optional[int], str] = {}
 
     # Send messages to all connections
     remove = []
@@ -52,19 +55,27 @@ async def broadcast_state(game_id: str):
                 will_send_hand=seat is not None
             )
 
-            # Use dict unpacking for faster shallow copy
-            payload = {**base}
-            # attach owner_hand only for that socket if seat is known
-            if seat is not None:
-                # Use pre-serialized hand from cache (no redundant serialization)
-                payload["owner_hand"] = hands_cache[seat]
-                logger.debug(
-                    "sending_hand_to_player",
-                    game_id=game_id,
-                    seat=seat,
-                    hand_size=len(payload["owner_hand"])
+            text = messages.get(seat)
+            if text is None:
+                # Use dict unpacking for faster shallow copy
+                payload = {**base}
+                # attach owner_hand only for that socket if seat is known
+                if seat is not None:
+                    payload["owner_hand"] = sess.get_hand_for(seat)
+                    logger.debug(
+                        "sending_hand_to_player",
+                        game_id=game_id,
+                        seat=seat,
+                        hand_size=len(payload["owner_hand"])
+                    )
+                # Same encoding as WebSocket.send_json
+                text = json.dumps(
+                    {"type": "state_snapshot", "payload": payload},
+                    separators=(",", ":"),
+                    ensure_ascii=False,
                 )
-            await ws.send_json({"type": "state_snapshot", "payload": payload})
+                messages[seat] = text
+            await ws.send_text(text)
         except Exception as e:
             # Log the error for debugging
             logger.warning(
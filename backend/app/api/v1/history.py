@@ -121,23 +121,21 @@ async def list_games(
             # Build response with players
             game_summaries = []
             for game in games:
-                # Get players for this game
+                # Get players for this game (plain rows, no ORM instances)
                 players_result = await db.execute(
-                    select(PlayerModel)
+                    select(
+                        PlayerModel.player_id,
+                        PlayerModel.name,
+                        PlayerModel.seat,
+                        PlayerModel.is_bot,
+                        PlayerModel.joined_at,
+                    )
                     .where(PlayerModel.game_id == game.id)
                     .order_by(PlayerModel.seat)
                 )
-                players = players_result.scalars().all()
 
                 player_summaries = [
-                    PlayerSummary(
-                        player_id=p.player_id,
-                        name=p.name,
-                        seat=p.seat,
-                        is_bot=p.is_bot,
-                        joined_at=p.joined_at,
-                    )
-                    for p in players
+                    PlayerSummary(**row._mapping) for row in players_result.all()
                 ]
 
                 game_summaries.append(
@@ -176,10 +174,7 @@ async def get_game_detail(game_id: str):
     try:
         async with AsyncSessionLocal() as db:
             # Get game
-            game_result = await db.execute(
-                select(GameModel).where(GameModel.id == game_id)
-            )
-            game = game_result.scalar_one_or_none()
+            game = await db.get(GameModel, game_id)
 
             if not game:
                 raise HTTPException(status_code=404, detail="Game not found")
@@ -372,10 +367,7 @@ async def get_game_replay(game_id: str):
     try:
         async with AsyncSessionLocal() as db:
             # Verify game exists
-            game_result = await db.execute(
-                select(GameModel).where(GameModel.id == game_id)
-            )
-            game = game_result.scalar_one_or_none()
+            game = await db.get(GameModel, game_id)
 
             if not game:
                 raise HTTPException(status_code=404, detail="Game not found")
@@ -76,14 +76,14 @@ async def restore_active_games():
             from app.db.repository import GameRepository
 
             repo = GameRepository(db)
-            active_games = await repo.get_active_games()
+            active_game_ids = await repo.get_active_game_ids()
 
             restored_count = 0
             async with server.lock():
-                for game_model in active_games:
-                    sess = await load_game_from_db(game_model.id)
+                for game_id in active_game_ids:
+                    sess = await load_game_from_db(game_id)
                     if sess:
-                        server.add_session(game_model.id, sess)
+                        server.add_session(game_id, sess)
                         restored_count += 1
 
             logger.info("active_games_restored", count=restored_count)
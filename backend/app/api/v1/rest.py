@@ -21,7 +21,7 @@ from app.api.v1.persistence_integration import load_game_from_db, save_game_stat
 from app.api.v1.router import router
 from app.constants import ErrorMessage
 from app.core.game_server import GameServer, get_game_server
-from app.db.config import get_db
+from app.db.config import AsyncSessionLocal, get_db
 from app.db.repository import GameRepository
 from app.game.enums import SessionState
 from app.game.session import GameSession
@@ -40,6 +40,31 @@ from app.models import (
 
 logger = get_logger(__name__)
 
+# How many generated short codes to check against the database before giving up
+SHORT_CODE_DB_ATTEMPTS = 10
+
+
+async def _generate_unique_short_code(server: GameServer) -> str:
+    """
+    Generate a short code not used by any in-memory or persisted game.
+
+    Candidates are checked against the database one at a time instead of
+    loading every stored code.
+    """
+    existing_codes = set(server.get_short_code_index())
+
+    async with AsyncSessionLocal() as db:
+        repo = GameRepository(db)
+        for _ in range(SHORT_CODE_DB_ATTEMPTS):
+            candidate = generate_short_code(existing_codes)
+            if not await repo.short_code_exists(candidate):
+                return candidate
+            existing_codes.add(candidate)
+
+    # Extremely unlikely: every candidate collided with a stored game
+    logger.warning("short_code_generation_exhausted", attempts=SHORT_CODE_DB_ATTEMPTS)
+    return f"game-{uuid.uuid4().hex[:8]}"
+
 
 @router.post("/game/create")
 async def create_game(
@@ -48,8 +73,7 @@ async def create_game(
 ):
     """Create a new game session with validation."""
     # Generate a unique short code
-    existing_codes = {sess.short_code for sess in server.get_all_sessions().values() if sess.short_code}
-    short_code = generate_short_code(existing_codes)
+    short_code = await _generate_unique_short_code(server)
 
     game = GameSession(mode=request.mode, seats=request.seats, short_code=short_code)
     server.add_session(game.id, game)
@@ -74,7 +98,12 @@ async def get_game(
     - Short code: /game/royal-turtle-65
     """
     # Resolve to actual game_id
-    game_id = await resolve_game_identifier(game_id_or_code, server.get_all_sessions(), raise_on_not_found=True)
+    game_id = await resolve_game_identifier(
+        game_id_or_code,
+        server.get_all_sessions(),
+        raise_on_not_found=True,
+        short_code_index=server.get_short_code_index(),
+    )
 
     if server.has_session(game_id):
         sess = server.get_session(game_id)
@@ -110,7 +139,12 @@ async def join_game(
     If the player is a bot, schedule the bot runner.
     """
     # Resolve to actual game_id
-    game_id = await resolve_game_identifier(game_id_or_code, server.get_all_sessions(), raise_on_not_found=True)
+    game_id = await resolve_game_identifier(
+        game_id_or_code,
+        server.get_all_sessions(),
+        raise_on_not_found=True,
+        short_code_index=server.get_short_code_index(),
+    )
 
     if not server.has_session(game_id):
         # Try to load from database
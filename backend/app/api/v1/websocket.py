@@ -64,7 +64,12 @@ async def ws_game(websocket: WebSocket, game_id_or_code: str):
     server = get_game_server()
 
     # Resolve short code to actual game_id
-    game_id = await resolve_game_identifier(game_id_or_code, server.get_all_sessions(), raise_on_not_found=False)
+    game_id = await resolve_game_identifier(
+        game_id_or_code,
+        server.get_all_sessions(),
+        raise_on_not_found=False,
+        short_code_index=server.get_short_code_index(),
+    )
 
     # Safely check and create/load session if needed
     async with server.lock():
@@ -91,7 +96,7 @@ async def ws_game(websocket: WebSocket, game_id_or_code: str):
         sess = server.get_session(game_id)
         await websocket.send_json({
             "type": "state_snapshot",
-            "payload": sess.get_public_state().model_dump()
+            "payload": sess.get_public_state_dict()
         })
     except Exception as e:
         logger.warning("initial_state_send_failed", game_id=game_id, error=str(e))
@@ -142,7 +147,7 @@ async def _handle_ws_message(websocket: WebSocket, game_id: str, data: dict):
 
     # Validate message structure
     try:
-        msg = WSMessage(**data)
+        msg = WSMessage.model_validate(data)
     except ValidationError as e:
         logger.warning("ws_message_validation_failed", game_id=game_id, error=str(e))
         await websocket.send_json({
@@ -159,26 +164,26 @@ async def _handle_ws_message(websocket: WebSocket, game_id: str, data: dict):
     # Validate and handle each message type
     try:
         if typ == "identify":
-            validated = WSIdentifyPayload(**payload)
+            validated = WSIdentifyPayload.model_validate(payload)
             await _handle_identify(websocket, game_id, sess, validated)
 
         elif typ == "request_state":
             await _handle_request_state(websocket, game_id, sess)
 
         elif typ == "place_bid":
-            validated = WSPlaceBidPayload(**payload)
+            validated = WSPlaceBidPayload.model_validate(payload)
             await _handle_place_bid(websocket, sess, validated)
 
         elif typ == "choose_trump":
-            validated = WSChooseTrumpPayload(**payload)
+            validated = WSChooseTrumpPayload.model_validate(payload)
             await _handle_choose_trump(websocket, sess, validated)
 
         elif typ == "play_card":
-            validated = WSPlayCardPayload(**payload)
+            validated = WSPlayCardPayload.model_validate(payload)
             await _handle_play_card(websocket, sess, validated)
 
         elif typ == "reveal_trump":
-            validated = WSRevealTrumpPayload(**payload)
+            validated = WSRevealTrumpPayload.model_validate(payload)
             await _handle_reveal_trump(websocket, sess, validated)
 
         else:
@@ -232,7 +237,7 @@ async def _handle_identify(websocket: WebSocket, game_id: str, sess, payload: WS
             {
                 "type": "state_snapshot",
                 "payload": {
-                    **sess.get_public_state().model_dump(),
+                    **sess.get_public_state_dict(),
                     "owner_hand": sess.get_hand_for(seat),
                     "player_connected": True,
                 },
@@ -248,7 +253,7 @@ async def _handle_identify(websocket: WebSocket, game_id: str, sess, payload: WS
         )
         # Send public state only
         await websocket.send_json(
-            {"type": "state_snapshot", "payload": sess.get_public_state().model_dump()}
+            {"type": "state_snapshot", "payload": sess.get_public_state_dict()}
         )
 
 
@@ -258,7 +263,7 @@ async def _handle_request_state(websocket: WebSocket, game_id: str, sess):
     conn_info = connection_manager.get_connection_info(websocket)
     seat = conn_info.seat if conn_info else None
 
-    payload_out = sess.get_public_state().model_dump()
+    payload_out = {**sess.get_public_state_dict()}
 
     if seat is not None:
         payload_out["owner_hand"] = sess.get_hand_for(seat)
@@ -20,6 +20,7 @@ class GameServer:
 
     This class encapsulates what were previously global dictionaries:
     - SESSIONS: Active game sessions by game_id
+    - short codes: Index of short_code -> game_id for active sessions
     - bot_tasks: Running bot tasks by game_id
     - sessions_lock: Lock for thread-safe access
 
@@ -32,6 +33,7 @@ class GameServer:
     def __init__(self):
         """Initialize empty game server state."""
         self._sessions: Dict[str, GameSession] = {}
+        self._short_codes: Dict[str, str] = {}
         self._bot_tasks: Dict[str, asyncio.Task] = {}
         self._lock = asyncio.Lock()
         logger.info("game_server_initialized")
@@ -45,12 +47,16 @@ class GameServer:
     def add_session(self, game_id: str, session: GameSession) -> None:
         """Add a new session to the server."""
         self._sessions[game_id] = session
+        if session.short_code:
+            self._short_codes[session.short_code] = game_id
         logger.info("session_added", game_id=game_id, total_sessions=len(self._sessions))
 
     def remove_session(self, game_id: str) -> Optional[GameSession]:
         """Remove and return a session. Returns None if not found."""
         session = self._sessions.pop(game_id, None)
         if session:
+            if session.short_code and self._short_codes.get(session.short_code) == game_id:
+                del self._short_codes[session.short_code]
             logger.info("session_removed", game_id=game_id, total_sessions=len(self._sessions))
         return session
 
@@ -62,6 +68,10 @@ class GameServer:
         """Get all active sessions (returns reference, use with lock!)."""
         return self._sessions
 
+    def get_short_code_index(self) -> Dict[str, str]:
+        """Get the short_code -> game_id index (returns reference, use with lock!)."""
+        return self._short_codes
+
     def session_count(self) -> int:
         """Get the number of active sessions."""
         return len(self._sessions)
@@ -8,6 +8,7 @@ import os
 import sys
 from typing import AsyncGenerator
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
@@ -28,11 +29,40 @@ else:
 DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DB)
 DATABASE_ECHO = os.getenv("DATABASE_ECHO", "false").lower() == "true"
 
+# Connection pool configuration
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "20"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "40"))
+DATABASE_POOL_TIMEOUT = int(os.getenv("DATABASE_POOL_TIMEOUT", "5"))
+DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+
+
+def _pool_options(database_url: str) -> dict:
+    """
+    Build queue pool options for the async engine.
+
+    In-memory SQLite databases use a static pool, which doesn't accept
+    sizing options, so they get the SQLAlchemy defaults.
+    """
+    url = make_url(database_url)
+    if url.database in (None, "", ":memory:") or url.query.get("mode") == "memory":
+        return {}
+    return {
+        "pool_size": DATABASE_POOL_SIZE,
+        "max_overflow": DATABASE_MAX_OVERFLOW,
+        "pool_timeout": DATABASE_POOL_TIMEOUT,
+        "pool_recycle": DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        # LIFO keeps the most recently used (warm) connections in rotation
+        "pool_use_lifo": True,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=DATABASE_ECHO,
     future=True,
+    **_pool_options(DATABASE_URL),
 )
 
 # Session factory
@@ -8,6 +8,7 @@ with automatic validation and serialization.
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -19,6 +20,10 @@ class GameModel(SQLModel, table=True):
     """
 
     __tablename__ = "games"
+    __table_args__ = (
+        # Serves the cleanup predicates (state = ? AND last_activity_at < ?)
+        Index("ix_games_state_last_activity", "state", "last_activity_at"),
+    )
 
     # Primary key
     id: str = Field(primary_key=True, max_length=36)
@@ -90,6 +95,10 @@ class GameStateSnapshotModel(SQLModel, table=True):
     """
 
     __tablename__ = "game_state_snapshots"
+    __table_args__ = (
+        # Serves latest-snapshot lookups (game_id = ? ORDER BY created_at)
+        Index("ix_snap_game_created", "game_id", "created_at"),
+    )
 
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -126,6 +135,10 @@ class RoundHistoryModel(SQLModel, table=True):
     """
 
     __tablename__ = "round_history"
+    __table_args__ = (
+        # One row per round; serves (game_id, round_number) lookups
+        Index("ix_round_game_num", "game_id", "round_number", unique=True),
+    )
 
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -69,8 +69,7 @@ class SessionPersistence:
 
             # Sync players (create/update) - do this on every save
             # Get existing players from database
-            existing_players = await self.player_repo.get_players_for_game(session.id)
-            existing_player_seats = {p.seat for p in existing_players}
+            existing_player_seats = await self.player_repo.get_player_seats(session.id)
 
             # Add any new players that aren't in the database yet
             for seat, player in session.players.items():
@@ -92,21 +91,21 @@ class SessionPersistence:
                 reason=snapshot_reason,
             )
 
-            # Save any new rounds to database
-            # Get count of rounds already saved
-            saved_rounds_count = await self.round_history_repo.get_round_count(
+            # Save any rounds not yet in the database, by round number
+            saved_round_numbers = await self.round_history_repo.get_round_numbers(
                 session.id
             )
-            # Save any new rounds from session.rounds_history
-            for round_data in session.rounds_history[saved_rounds_count:]:
+            for record in session.rounds_history:
+                if record.round_number in saved_round_numbers:
+                    continue
                 await self.round_history_repo.save_round(
                     game_id=session.id,
-                    round_number=round_data["round_number"],
-                    dealer=round_data["dealer"],
-                    bid_winner=round_data.get("bid_winner"),
-                    bid_value=round_data.get("bid_value"),
-                    trump=round_data.get("trump"),
-                    round_data=round_data,  # Entire round data dict
+                    round_number=record.round_number,
+                    dealer=record.dealer,
+                    bid_winner=record.bid_winner,
+                    bid_value=record.bid_value,
+                    trump=record.trump,
+                    round_data=record.to_dict(),  # Entire round data dict
                 )
 
             await self.db.commit()
@@ -208,7 +207,7 @@ class SessionPersistence:
             "hands": [[self._card_to_dict(c) for c in hand] for hand in session.hands],
             # Bidding
             "bids": session.bidding_manager.get_bids_dict(),
-            "bids_received": list(session.bidding_manager.bids_received),
+            "bids_received": session.bidding_manager.get_bids_received(),
             "current_highest": session.bidding_manager.current_highest,
             "bid_winner": session.bidding_manager.bid_winner,
             "bid_value": session.bidding_manager.bid_value,
@@ -228,7 +227,7 @@ class SessionPersistence:
             ),
             "captured_tricks": [
                 [winner, [[s, self._card_to_dict(c)] for s, c in trick]]
-                for winner, trick in session.trick_manager.captured_tricks
+                for winner, trick, _ in session.trick_manager.captured_tricks
             ],
             "points_by_seat": session.points_by_seat,
         }
@@ -254,11 +253,12 @@ class SessionPersistence:
         session.hands = [
             [self._dict_to_card(c) for c in hand] for hand in data["hands"]
         ]
+        session.cards_remaining = sum(len(h) for h in session.hands)
 
         # Restore bidding using BiddingManager
         session.bidding_manager.restore_from_state(
             bids={int(k): v for k, v in data["bids"].items()},
-            bids_received=set(data["bids_received"]),
+            bids_received=data["bids_received"],
             current_highest=data["current_highest"],
             bid_winner=data["bid_winner"],
             bid_value=data["bid_value"],
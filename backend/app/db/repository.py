@@ -7,9 +7,10 @@ Provides async methods for CRUD operations on game data.
 
 import json
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from sqlalchemy import delete, select
+from sqlalchemy import and_, case, delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants import GameConfig
@@ -53,11 +54,8 @@ class GameRepository:
         return game
 
     async def get_game(self, game_id: str) -> Optional[GameModel]:
-        """Retrieve a game by ID."""
-        result = await self.session.execute(
-            select(GameModel).where(GameModel.id == game_id)
-        )
-        return result.scalar_one_or_none()
+        """Retrieve a game by ID (served from the identity map when already loaded)."""
+        return await self.session.get(GameModel, game_id)
 
     async def get_game_by_short_code(self, short_code: str) -> Optional[GameModel]:
         """Retrieve a game by short code."""
@@ -66,6 +64,13 @@ class GameRepository:
         )
         return result.scalar_one_or_none()
 
+    async def short_code_exists(self, short_code: str) -> bool:
+        """Check whether a short code is already taken, without loading the game."""
+        result = await self.session.execute(
+            select(1).where(GameModel.short_code == short_code).limit(1)
+        )
+        return result.first() is not None
+
     async def update_game_state(
         self, game_id: str, state: str, phase_data: Optional[dict] = None
     ) -> bool:
@@ -84,11 +89,11 @@ class GameRepository:
         logger.debug("game_state_updated", game_id=game_id, state=state)
         return True
 
-    async def get_active_games(self) -> List[GameModel]:
-        """Get all active games (not in terminal states)."""
+    async def get_active_game_ids(self) -> List[str]:
+        """Get IDs of all active games (not in terminal states)."""
         terminal_states = ["completed", "abandoned"]
         result = await self.session.execute(
-            select(GameModel).where(GameModel.state.not_in(terminal_states))
+            select(GameModel.id).where(GameModel.state.not_in(terminal_states))
         )
         return list(result.scalars().all())
 
@@ -126,46 +131,51 @@ class GameRepository:
         Returns number of games deleted.
         """
         now = datetime.now(timezone.utc)
-        deleted_count = 0
-
-        # Cleanup lobby games older than lobby_hours
         lobby_cutoff = now - timedelta(hours=lobby_hours)
-        lobby_games = await self.session.execute(
-            select(GameModel).where(
-                GameModel.state == "lobby", GameModel.last_activity_at < lobby_cutoff
-            )
-        )
-        for game in lobby_games.scalars():
-            await self.delete_game(game.id)
-            deleted_count += 1
-
-        # Cleanup active games with no activity for active_hours
         active_cutoff = now - timedelta(hours=active_hours)
+        completed_cutoff = now - timedelta(hours=completed_hours)
         active_states = ["bidding", "choose_trump", "play", "scoring"]
-        active_games = await self.session.execute(
-            select(GameModel).where(
-                GameModel.state.in_(active_states),
-                GameModel.last_activity_at < active_cutoff,
-            )
-        )
-        for game in active_games.scalars():
-            await self.delete_game(game.id)
-            deleted_count += 1
+        terminal_states = ["completed", "abandoned"]
 
-        # Cleanup completed games older than completed_hours
-        completed_cutoff = now - timedelta(hours=completed_hours)
-        completed_games = await self.session.execute(
-            select(GameModel).where(
-                GameModel.state.in_(["completed", "abandoned"]),
-                GameModel.last_activity_at < completed_cutoff,
+        # Find expired games for all three buckets in a single query:
+        # - lobby games older than lobby_hours
+        # - active games with no activity for active_hours
+        # - completed games older than completed_hours
+        bucket = case(
+            (GameModel.state == "lobby", "lobby"),
+            (GameModel.state.in_(active_states), "active"),
+            else_="completed",
+        ).label("bucket")
+        expired = await self.session.execute(
+            select(GameModel.id, bucket).where(
+                or_(
+                    and_(
+                        GameModel.state == "lobby",
+                        GameModel.last_activity_at < lobby_cutoff,
+                    ),
+                    and_(
+                        GameModel.state.in_(active_states),
+                        GameModel.last_activity_at < active_cutoff,
+                    ),
+                    and_(
+                        GameModel.state.in_(terminal_states),
+                        GameModel.last_activity_at < completed_cutoff,
+                    ),
+                )
             )
         )
-        for game in completed_games.scalars():
-            await self.delete_game(game.id)
+
+        deleted_count = 0
+        deleted_by_bucket = {"lobby": 0, "active": 0, "completed": 0}
+        for game_id, game_bucket in expired.all():
+            await self.delete_game(game_id)
             deleted_count += 1
+            deleted_by_bucket[game_bucket] += 1
 
         if deleted_count > 0:
-            logger.info("old_games_cleaned_up", count=deleted_count)
+            logger.info(
+                "old_games_cleaned_up", count=deleted_count, **deleted_by_bucket
+            )
 
         return deleted_count
 
@@ -199,6 +209,22 @@ class PlayerRepository:
         )
         return list(result.scalars().all())
 
+    async def get_player_seats(self, game_id: str) -> Set[int]:
+        """Get the occupied seats for a game without loading player rows."""
+        result = await self.session.execute(
+            select(PlayerModel.seat).where(PlayerModel.game_id == game_id)
+        )
+        return set(result.scalars().all())
+
+    async def get_player_names(self, game_id: str) -> List[str]:
+        """Get player names for a game, ordered by seat."""
+        result = await self.session.execute(
+            select(PlayerModel.name)
+            .where(PlayerModel.game_id == game_id)
+            .order_by(PlayerModel.seat)
+        )
+        return list(result.scalars().all())
+
     async def remove_player(self, game_id: str, player_id: str) -> bool:
         """Remove a player from a game."""
         result = await self.session.execute(
@@ -280,27 +306,39 @@ class RoundHistoryRepository:
         bid_value: Optional[int],
         trump: Optional[str],
         round_data: dict,
-    ) -> RoundHistoryModel:
-        """Save a completed round to the database."""
-        round_history = RoundHistoryModel(
-            game_id=game_id,
-            round_number=round_number,
-            dealer=dealer,
-            bid_winner=bid_winner,
-            bid_value=bid_value,
-            trump=trump,
-            round_data=json.dumps(round_data),
-        )
-        self.session.add(round_history)
-        await self.session.flush()
-        logger.info(
-            "round_saved_to_db",
-            game_id=game_id,
-            round_number=round_number,
-            bid_winner=bid_winner,
-            trump=trump,
+    ) -> bool:
+        """
+        Save a completed round to the database.
+
+        Concurrent saves of the same game can both try to insert a round, so
+        an existing (game_id, round_number) row is left alone rather than
+        failing the caller's transaction. Returns True if a row was inserted.
+        """
+        result = await self.session.execute(
+            sqlite_insert(RoundHistoryModel)
+            .values(
+                game_id=game_id,
+                round_number=round_number,
+                dealer=dealer,
+                bid_winner=bid_winner,
+                bid_value=bid_value,
+                trump=trump,
+                round_data=json.dumps(round_data),
+                # Core inserts skip the model's default_factory
+                created_at=datetime.now(timezone.utc),
+            )
+            .on_conflict_do_nothing(index_elements=["game_id", "round_number"])
         )
-        return round_history
+        inserted = result.rowcount > 0
+        if inserted:
+            logger.info(
+                "round_saved_to_db",
+                game_id=game_id,
+                round_number=round_number,
+                bid_winner=bid_winner,
+                trump=trump,
+            )
+        return inserted
 
     async def get_rounds_for_game(self, game_id: str) -> List[RoundHistoryModel]:
         """Get all rounds for a game, ordered by round number."""
@@ -321,10 +359,20 @@ class RoundHistoryRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_round_numbers(self, game_id: str) -> Set[int]:
+        """Get the round numbers already saved for a game."""
+        result = await self.session.execute(
+            select(RoundHistoryModel.round_number).where(
+                RoundHistoryModel.game_id == game_id
+            )
+        )
+        return set(result.scalars().all())
+
     async def get_round_count(self, game_id: str) -> int:
         """Get the total number of rounds played in a game."""
         result = await self.session.execute(
-            select(RoundHistoryModel)
+            select(func.count())
+            .select_from(RoundHistoryModel)
             .where(RoundHistoryModel.game_id == game_id)
         )
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
@@ -1,15 +1,20 @@
 # backend/app/game/ai.py
 from __future__ import annotations
 import random
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.constants import AIConfig, BidValue, GameConfig
 from app.game.rules import CARD_POINTS, RANK_INDEX, Card
 
+# Lead preference per rank: (card points, rank index), compared as a tuple
+LEAD_SCORE: Dict[str, Tuple[int, int]] = {
+    rank: (CARD_POINTS.get(rank, 0), index) for rank, index in RANK_INDEX.items()
+}
+
 
 def choose_trump_suit(hand: List[Card]) -> str:
     """Pick the suit with the most cards in hand. Tie-break randomly."""
-    counts = {}
+    counts: Dict[str, int] = {}
     for c in hand:
         counts[c.suit] = counts.get(c.suit, 0) + 1
     # choose suit with max count; tie-breaker random
@@ -27,9 +32,9 @@ def select_card_to_play(
          - if have trump, play lowest trump to try win cheaply
          - otherwise play lowest overall (throwaway)
     """
-    # sort helper: by rank index (low->high)
-    hand_sorted = sorted(hand, key=lambda c: RANK_INDEX[c.rank])
     if lead_suit:
+        # sort helper: by rank index (low->high)
+        hand_sorted = sorted(hand, key=lambda c: RANK_INDEX[c.rank])
         follow = [c for c in hand_sorted if c.suit == lead_suit]
         if follow:
             return follow[0]
@@ -43,18 +48,14 @@ def select_card_to_play(
     else:
         # lead the trick: choose highest card to try to win or safe
         # but simple strategy: lead highest-point card (J/9/A/10), else highest rank
-        def score_for_lead(card: Card):
-            return (CARD_POINTS.get(card.rank, 0), RANK_INDEX[card.rank])
-
-        best = max(hand_sorted, key=score_for_lead)
-        return best
+        return max(hand, key=lambda c: LEAD_SCORE[c.rank])
 
 
 # A minimal estimate function kept for future use; easy mode ignores deep heuristics.
-def estimate_hand_points(hand: List) -> int:
+def estimate_hand_points(hand: List[Any]) -> int:
     """Lightweight heuristic (not used by easy mode bidding much)."""
     # hand is a list of Card-like objects with .rank; we give higher ranks small weights.
-    rank_score = {
+    rank_score: Dict[Optional[str], int] = {
         "A": 4,
         "K": 3,
         "Q": 2,
@@ -72,7 +73,7 @@ def estimate_hand_points(hand: List) -> int:
 
 
 def choose_bid_value(
-    hand,
+    hand: List[Card],
     min_bid: int = GameConfig.MIN_BID_DEFAULT,
     max_total: int = GameConfig.MAX_BID_28,
     current_highest: Optional[int] = None,
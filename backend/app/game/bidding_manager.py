@@ -6,10 +6,16 @@ This class consolidates bidding state management, validation, and winner determi
 that were previously scattered throughout the GameSession class.
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from app.constants import BidValue, GameConfig, GameMode
 
+# Highest allowed bid per mode; anything other than 28 uses the 56 cap
+MAX_BID_BY_MODE: Dict[str, int] = {
+    GameMode.MODE_28.value: GameConfig.MAX_BID_28,
+    GameMode.MODE_56.value: GameConfig.MAX_BID_56,
+}
+
 
 class BiddingManager:
     """
@@ -23,19 +29,21 @@ class BiddingManager:
     - Provide bidding state for serialization
     """
 
-    def __init__(self, seats: int):
+    def __init__(self, seats: int) -> None:
         """Initialize bidding state for given number of seats."""
         self.seats = seats
         self.bids: Dict[int, Optional[int]] = {i: None for i in range(seats)}
-        self.bids_received: set[int] = set()
+        # bit i set once seat i has bid or passed
+        self.bids_received_mask: int = 0
+        self._all_received_mask: int = (1 << seats) - 1
         self.current_highest: Optional[int] = None
         self.bid_winner: Optional[int] = None
         self.bid_value: Optional[int] = None
 
-    def reset(self):
+    def reset(self) -> None:
         """Reset all bidding state (called when starting new round)."""
         self.bids = {i: None for i in range(self.seats)}
-        self.bids_received = set()
+        self.bids_received_mask = 0
         self.current_highest = None
         self.bid_winner = None
         self.bid_value = None
@@ -58,12 +66,12 @@ class BiddingManager:
         # Handle pass
         if value is None or value == BidValue.PASS:
             self.bids[seat] = BidValue.PASS
-            self.bids_received.add(seat)
+            self.bids_received_mask |= 1 << seat
             return True, "Pass recorded"
 
         # Record numeric bid
         self.bids[seat] = value
-        self.bids_received.add(seat)
+        self.bids_received_mask |= 1 << seat
 
         # Update highest bid if this is higher
         if self.current_highest is None or value > self.current_highest:
@@ -103,9 +111,7 @@ class BiddingManager:
         if value < min_bid:
             return False, f"Bid must be >= {min_bid}"
 
-        max_total = (
-            GameConfig.MAX_BID_28 if mode == GameMode.MODE_28.value else GameConfig.MAX_BID_56
-        )
+        max_total = MAX_BID_BY_MODE.get(mode, GameConfig.MAX_BID_56)
         if value > max_total:
             return False, f"Bid cannot exceed {max_total}"
 
@@ -116,7 +122,7 @@ class BiddingManager:
 
     def is_complete(self) -> bool:
         """Check if all seats have placed bids."""
-        return all(v is not None for v in self.bids.values())
+        return self.bids_received_mask == self._all_received_mask
 
     def all_passed(self) -> bool:
         """Check if all seats passed (no valid bids)."""
@@ -126,17 +132,23 @@ class BiddingManager:
         """Get bids as dict for API serialization."""
         return dict(self.bids)
 
+    def get_bids_received(self) -> List[int]:
+        """Get seats that have bid or passed, in seat order."""
+        return [s for s in range(self.seats) if self.bids_received_mask >> s & 1]
+
     def restore_from_state(
         self,
         bids: Dict[int, Optional[int]],
-        bids_received: set[int],
+        bids_received: Iterable[int],
         current_highest: Optional[int],
         bid_winner: Optional[int],
         bid_value: Optional[int],
-    ):
+    ) -> None:
         """Restore bidding state from saved game state."""
         self.bids = bids
-        self.bids_received = bids_received
+        self.bids_received_mask = 0
+        for seat in bids_received:
+            self.bids_received_mask |= 1 << seat
         self.current_highest = current_highest
         self.bid_winner = bid_winner
         self.bid_value = bid_value
@@ -7,13 +7,86 @@ scattered throughout the GameSession class, making the logic easier to test
 and maintain.
 """
 
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from app.game.enums import HiddenTrumpMode
 from app.game.rules import Card
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+RevealResult = Tuple[bool, Optional[str]]
+
+
+def _reveal_open_immediately(
+    played_card: Card,
+    trump_suit: str,
+    trump_owner_seat: Optional[int],
+    player_seat: int,
+    current_trick: List[Tuple[int, Card]],
+    player_hand: List[Card],
+) -> RevealResult:
+    """OPEN_IMMEDIATELY: trump is revealed on the first card played."""
+    return True, "open_immediately_mode"
+
+
+def _reveal_on_first_trump_play(
+    played_card: Card,
+    trump_suit: str,
+    trump_owner_seat: Optional[int],
+    player_seat: int,
+    current_trick: List[Tuple[int, Card]],
+    player_hand: List[Card],
+) -> RevealResult:
+    """ON_FIRST_TRUMP_PLAY: reveal as soon as any trump card is played."""
+    if played_card.suit == trump_suit:
+        return True, f"first_trump_played_by_seat_{player_seat}"
+    return False, None
+
+
+def _reveal_on_first_nonfollow(
+    played_card: Card,
+    trump_suit: str,
+    trump_owner_seat: Optional[int],
+    player_seat: int,
+    current_trick: List[Tuple[int, Card]],
+    player_hand: List[Card],
+) -> RevealResult:
+    """ON_FIRST_NONFOLLOW: reveal when any player holding the lead suit doesn't follow."""
+    if current_trick:
+        lead_suit = current_trick[0][1].suit
+        # Check if player had lead suit but didn't follow
+        player_has_lead = any(c.suit == lead_suit for c in player_hand)
+        if player_has_lead and played_card.suit != lead_suit:
+            return True, f"nonfollow_by_seat_{player_seat}"
+    return False, None
+
+
+def _reveal_on_bidder_nonfollow(
+    played_card: Card,
+    trump_suit: str,
+    trump_owner_seat: Optional[int],
+    player_seat: int,
+    current_trick: List[Tuple[int, Card]],
+    player_hand: List[Card],
+) -> RevealResult:
+    """ON_BIDDER_NONFOLLOW: reveal only when the trump owner doesn't follow suit."""
+    if player_seat == trump_owner_seat and current_trick:
+        lead_suit = current_trick[0][1].suit
+        # Check if bidder had lead suit but didn't follow
+        player_has_lead = any(c.suit == lead_suit for c in player_hand)
+        if player_has_lead and played_card.suit != lead_suit:
+            return True, f"bidder_nonfollow_seat_{player_seat}"
+    return False, None
+
+
+# Reveal mode -> handler, so each card play costs a single dict lookup
+_REVEAL_HANDLERS: Dict[HiddenTrumpMode, Callable[..., RevealResult]] = {
+    HiddenTrumpMode.OPEN_IMMEDIATELY: _reveal_open_immediately,
+    HiddenTrumpMode.ON_FIRST_TRUMP_PLAY: _reveal_on_first_trump_play,
+    HiddenTrumpMode.ON_FIRST_NONFOLLOW: _reveal_on_first_nonfollow,
+    HiddenTrumpMode.ON_BIDDER_NONFOLLOW: _reveal_on_bidder_nonfollow,
+}
+
 
 class HiddenTrumpManager:
     """
@@ -60,33 +133,18 @@ class HiddenTrumpManager:
         if trump_suit is None:
             return False, None
 
-        # Check each reveal mode
-        if hidden_trump_mode == HiddenTrumpMode.OPEN_IMMEDIATELY:
-            return True, "open_immediately_mode"
-
-        if hidden_trump_mode == HiddenTrumpMode.ON_FIRST_TRUMP_PLAY:
-            if played_card.suit == trump_suit:
-                return True, f"first_trump_played_by_seat_{player_seat}"
-
-        if hidden_trump_mode == HiddenTrumpMode.ON_FIRST_NONFOLLOW:
-            if current_trick and len(current_trick) >= 1:
-                lead_suit = current_trick[0][1].suit
-                # Check if player had lead suit but didn't follow
-                player_has_lead = any(c.suit == lead_suit for c in player_hand)
-                if player_has_lead and played_card.suit != lead_suit:
-                    return True, f"nonfollow_by_seat_{player_seat}"
-
-        if hidden_trump_mode == HiddenTrumpMode.ON_BIDDER_NONFOLLOW:
-            if player_seat == trump_owner_seat:
-                if current_trick:
-                    lead_suit = current_trick[0][1].suit
-                    # Check if bidder had lead suit but didn't follow
-                    player_has_lead = any(c.suit == lead_suit for c in player_hand)
-                    if player_has_lead and played_card.suit != lead_suit:
-                        return True, f"bidder_nonfollow_seat_{player_seat}"
-
-        # No reveal condition met
-        return False, None
+        # Dispatch to the handler for this reveal mode
+        handler = _REVEAL_HANDLERS.get(hidden_trump_mode)
+        if handler is None:
+            return False, None
+        return handler(
+            played_card,
+            trump_suit,
+            trump_owner_seat,
+            player_seat,
+            current_trick,
+            player_hand,
+        )
 
     @staticmethod
     def validate_manual_reveal(
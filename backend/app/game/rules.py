@@ -1,7 +1,7 @@
 # backend/app/game/rules.py
 from __future__ import annotations
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 from app.constants import CardPoints, CardRank, GameConfig, GameMode, Suit
@@ -35,21 +35,60 @@ CARD_POINTS = {
 }
 
 
-@dataclass(frozen=True)
+# Packed card face codes: (suit index << 3) | rank index, 0..31.
+# Hot paths index the *_BY_CODE tables with card.code instead of hashing strings.
+SUIT_INDEX = {s: i for i, s in enumerate(SUITS)}
+RANK_CODE_INDEX = {r: i for i, r in enumerate(RANKS_28)}
+CARD_CODES = {
+    (s, r): (si << 3) | ri
+    for s, si in SUIT_INDEX.items()
+    for r, ri in RANK_CODE_INDEX.items()
+}
+POINTS_BY_CODE = tuple(CARD_POINTS.get(r, 0) for _ in SUITS for r in RANKS_28)
+TRUMP_RANK_VALUE_BY_CODE = tuple(TRUMP_RANK_INDEX[r] for _ in SUITS for r in RANKS_28)
+NON_TRUMP_RANK_VALUE_BY_CODE = tuple(
+    NON_TRUMP_RANK_INDEX[r] for _ in SUITS for r in RANKS_28
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
     suit: str
     rank: str
     uid: str  # unique id across decks, e.g. "A♠#1"
+    code: int = field(init=False, repr=False, compare=False)  # packed suit/rank
+    _dict: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "code", CARD_CODES[(self.suit, self.rank)])
+        object.__setattr__(
+            self, "_dict", {"suit": self.suit, "rank": self.rank, "id": self.uid}
+        )
 
     @property
     def id(self) -> str:
         return self.uid
 
     def points(self) -> int:
-        return CARD_POINTS.get(self.rank, 0)
+        return POINTS_BY_CODE[self.code]
 
     def to_dict(self) -> dict:
-        return {"suit": self.suit, "rank": self.rank, "id": self.uid}
+        # Cards are shared across games via the prebuilt decks, so hand out a copy
+        return dict(self._dict)
+
+
+def _build_deck(decks: int) -> Tuple[Card, ...]:
+    return tuple(
+        Card(suit=s, rank=r, uid=f"{r}{s}#{d+1}")
+        for d in range(decks)
+        for s in SUITS
+        for r in RANKS_28
+    )
+
+
+# Deck contents are fixed per deck count and cards are immutable, so build them once
+_SINGLE_DECK = _build_deck(1)
+_DOUBLE_DECK = _build_deck(2)
 
 
 def make_deck(
@@ -59,16 +98,9 @@ def make_deck(
     Create deck for mode "28" (default) or "56".
     For 56-mode default we merge two 32-card decks (64 cards) and treat them as unique.
     """
-    decks = 1
     if mode == GameMode.MODE_56.value and two_decks_for_56:
-        decks = 2
-    cards: List[Card] = []
-    for d in range(decks):
-        for s in SUITS:
-            for r in RANKS_28:
-                uid = f"{r}{s}#{d+1}"
-                cards.append(Card(suit=s, rank=r, uid=uid))
-    return cards
+        return list(_DOUBLE_DECK)
+    return list(_SINGLE_DECK)
 
 
 def shuffle_deck(deck: List[Card], rng: Optional[random.Random] = None) -> List[Card]:
@@ -113,20 +145,19 @@ def deal(deck: List[Card], seats: int) -> Tuple[List[List[Card]], List[Card]]:
     """
     if seats <= 0:
         raise ValueError("seats must be > 0")
-    hand_size = len(deck) // seats
-    hands = [[] for _ in range(seats)]
-    for i in range(hand_size * seats):
-        hands[i % seats].append(deck[i])
-    kitty = deck[hand_size * seats :]
+    total = (len(deck) // seats) * seats
+    # seat i gets cards i, i + seats, i + 2*seats, ... via a strided slice
+    hands: List[List[Card]] = [deck[i:total:seats] for i in range(seats)]
+    kitty = deck[total:]
     return hands, kitty
 
 
 def get_rank_value(card: Card, is_trump: bool) -> int:
     """Get the rank value of a card (higher value = stronger card)."""
     if is_trump:
-        return TRUMP_RANK_INDEX[card.rank]
+        return TRUMP_RANK_VALUE_BY_CODE[card.code]
     else:
-        return NON_TRUMP_RANK_INDEX[card.rank]
+        return NON_TRUMP_RANK_VALUE_BY_CODE[card.code]
 
 
 def determine_trick_winner(trick: List[Tuple[int, Card]], trump: Optional[str]) -> int:
@@ -149,7 +180,7 @@ def determine_trick_winner(trick: List[Tuple[int, Card]], trump: Optional[str])
     if not trick:
         raise ValueError("empty trick")
     lead_suit = trick[0][1].suit
-    candidates = []
+    candidates: List[Tuple[int, Card]] = []
     is_trump_trick = False
 
     # Check if there are trump cards in the trick
@@ -164,18 +195,15 @@ def determine_trick_winner(trick: List[Tuple[int, Card]], trump: Optional[str])
         candidates = [t for t in trick if t[1].suit == lead_suit]
         is_trump_trick = False
 
-    # Find the highest ranked card among candidates
-    winner = candidates[0]
-    winner_rank_value = get_rank_value(winner[1], is_trump_trick)
-
-    for entry in candidates[1:]:
-        entry_rank_value = get_rank_value(entry[1], is_trump_trick)
-        if entry_rank_value > winner_rank_value:
-            winner = entry
-            winner_rank_value = entry_rank_value
+    # A lone trump or lone lead-suit card wins outright
+    if len(candidates) == 1:
+        return candidates[0][0]
 
-    return winner[0]
+    # Highest rank wins; max() keeps the first of equal keys, so the earliest
+    # played card wins ties between duplicate cards from merged decks
+    table = TRUMP_RANK_VALUE_BY_CODE if is_trump_trick else NON_TRUMP_RANK_VALUE_BY_CODE
+    return max(candidates, key=lambda t: table[t[1].code])[0]
 
 
 def trick_points(trick: List[Tuple[int, Card]]) -> int:
-    return sum(c.points() for (_, c) in trick)
+    return sum(POINTS_BY_CODE[c.code] for (_, c) in trick)
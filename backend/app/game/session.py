@@ -1,27 +1,75 @@
 # backend/app/game/session.py
 from __future__ import annotations
 import asyncio
+import logging
 import random
 import uuid
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.constants import BidValue, ErrorMessage, GameConfig, GameMode, Suit
+from app.constants import BidValue, ErrorMessage, GameConfig, GameMode
 from app.game.enums import HiddenTrumpMode, SessionState
 from app.game.rules import (
+    SUIT_INDEX,
+    SUITS,
     Card,
     deal,
     make_deck,
-    shuffle_deck,
     trick_points,
 )
-from app.game.bidding_manager import BiddingManager
+from app.game.bidding_manager import MAX_BID_BY_MODE, BiddingManager
 from app.game.hidden_trump import HiddenTrumpManager
 from app.game.trick_manager import TrickManager
 from app.logging_config import get_logger
-from app.models import BidCmd, ChooseTrumpCmd, GameStateDTO, PlayCardCmd, PlayerInfo
+from app.models import (
+    BidCmd,
+    CardDTO,
+    ChooseTrumpCmd,
+    GameStateDTO,
+    PlayCardCmd,
+    PlayerInfo,
+)
 
 logger = get_logger(__name__)
 
+_VALID_SUITS = frozenset(SUITS)
+
+
+@dataclass(slots=True)
+class _SuitIndex:
+    """Per-seat suit counts and presence bitmask, tied to the hand list it indexes."""
+
+    hand: List[Card]
+    length: int
+    counts: List[int]  # indexed by suit
+    mask: int  # bit per suit present in the hand
+
+
+@dataclass(frozen=True, slots=True)
+class RoundRecord:
+    """Immutable summary of a completed round, appended to the round history."""
+
+    round_number: int
+    dealer: int
+    bid_winner: Optional[int]
+    bid_value: Optional[int]
+    trump: Optional[str]
+    captured_tricks: Tuple[Dict[str, Any], ...]
+    points_by_seat: Tuple[int, ...]  # indexed by seat
+    team_scores: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "round_number": self.round_number,
+            "dealer": self.dealer,
+            "bid_winner": self.bid_winner,
+            "bid_value": self.bid_value,
+            "trump": self.trump,
+            "captured_tricks": list(self.captured_tricks),
+            "points_by_seat": dict(enumerate(self.points_by_seat)),
+            "team_scores": self.team_scores,
+        }
+
 
 class GameSession:
     def __init__(
@@ -42,9 +90,14 @@ class GameSession:
         self.min_bid = min_bid
         self.two_decks_for_56 = two_decks_for_56
 
+        self._rng = random.Random()
         self.deck: List[Card] = []
         self.kitty: List[Card] = []
         self.hands: List[List[Card]] = [[] for _ in range(seats)]
+        # cards left in all hands; the round ends when this reaches zero
+        self.cards_remaining: int = 0
+        # cached _SuitIndex per seat, rebuilt when the hand list identity or length changes
+        self._suit_index: List[Optional[_SuitIndex]] = [None] * seats
         self.players: Dict[int, PlayerInfo] = {}  # seat -> PlayerInfo
         self.state: SessionState = SessionState.LOBBY
 
@@ -60,13 +113,22 @@ class GameSession:
         self.current_dealer: int = 0  # tracks dealer position, rotates clockwise
         self.leader: int = 0  # seat index of player to dealer's left (first to bid/play)
         self.turn: int = 0
-        self.trick_manager = TrickManager()
+        # seats never change after construction, so precompute clockwise successors
+        self._next_seat: Tuple[int, ...] = tuple((s - 1) % seats for s in range(seats))
+        self.trick_manager = TrickManager(seats)
 
         # per-seat points captured (for convenience)
         self.points_by_seat: Dict[int, int] = {i: 0 for i in range(seats)}
 
+        # memoized public state; cleared by every mutating method
+        self._public_state_cache: Optional[GameStateDTO] = None
+        # model_dump() of the cached DTO, paired with the DTO it came from
+        self._public_state_dump: Optional[Tuple[GameStateDTO, Dict[str, Any]]] = None
+
         # round history - track completed rounds for replay/analysis
-        self.rounds_history: List[Dict[str, any]] = []
+        self.rounds_history: List[RoundRecord] = []
+        # serialized mirror of rounds_history, extended once per round
+        self._rounds_history_dicts: List[Dict[str, Any]] = []
 
         # locks
         self._lock = asyncio.Lock()
@@ -78,6 +140,7 @@ class GameSession:
         Returns the assigned seat integer.
         """
         async with self._lock:
+            self._public_state_cache = None
             if not isinstance(player, PlayerInfo):
                 raise TypeError("player must be a PlayerInfo instance")
 
@@ -90,29 +153,21 @@ class GameSession:
 
     async def remove_player(self, seat: int):
         async with self._lock:
+            self._public_state_cache = None
             self.players.pop(seat, None)
 
     async def start_round(self, dealer: int = 0):
         async with self._lock:
+            self._public_state_cache = None
             # Save previous round to history before resetting (if there was one)
             if self.trick_manager.captured_tricks:  # If there was a previous round
-                round_data = {
-                    "round_number": len(self.rounds_history) + 1,
-                    "dealer": self.current_dealer,  # Previous dealer
-                    "bid_winner": self.bidding_manager.bid_winner,
-                    "bid_value": self.bidding_manager.bid_value,
-                    "trump": self.trump,
-                    "captured_tricks": self.trick_manager.get_captured_tricks_for_serialization(),
-                    "points_by_seat": dict(self.points_by_seat),
-                    "team_scores": self.compute_scores(),
-                }
-                self.rounds_history.append(round_data)
+                record = self._record_round(self.current_dealer)  # Previous dealer
                 logger.info(
                     "round_saved_to_history",
                     game_id=self.id,
-                    round_number=round_data["round_number"],
+                    round_number=record.round_number,
                     bid_winner=self.bidding_manager.bid_winner,
-                    team_scores=round_data["team_scores"],
+                    team_scores=record.team_scores,
                 )
 
                 # Rotate dealer clockwise for next round
@@ -129,10 +184,12 @@ class GameSession:
 
             self.state = SessionState.DEALING
             # build deck
-            self.deck = shuffle_deck(
-                make_deck(self.mode, self.two_decks_for_56), random.Random()
-            )
+            # make_deck hands back a fresh list, so shuffle it in place
+            self.deck = make_deck(self.mode, self.two_decks_for_56)
+            self._rng.shuffle(self.deck)
             self.hands, self.kitty = deal(self.deck, self.seats)
+            self.cards_remaining = sum(len(h) for h in self.hands)
+            self._suit_index = [None] * self.seats
 
             # Leader is the player to dealer's LEFT (next player clockwise)
             # In clockwise play, that's dealer - 1
@@ -160,7 +217,11 @@ class GameSession:
         return [c.to_dict() for c in self.hands[seat]]
 
     def get_public_state(self) -> GameStateDTO:
-        # Compose a DTO with public info; individual hand info is not included here
+        # Compose a DTO with public info; individual hand info is not included here.
+        # The DTO is rebuilt only after a mutating method has run.
+        if self._public_state_cache is not None:
+            return self._public_state_cache
+
         players_list = [
             p for _, p in sorted(self.players.items(), key=lambda kv: kv[0])
         ]
@@ -170,7 +231,9 @@ class GameSession:
         lead_suit = self.trick_manager.get_lead_suit()
         last_trick_dict = self.trick_manager.get_last_trick_dict()
 
-        dto = GameStateDTO(
+        # Built from session state that was validated on the way in, so skip
+        # validation; containers the session keeps mutating are copied
+        dto = GameStateDTO.model_construct(
             game_id=self.id,
             short_code=self.short_code,
             mode=self.mode,
@@ -181,20 +244,33 @@ class GameSession:
             leader=self.leader,
             turn=self.turn,
             trump=None if self.trump_hidden else self.trump,
-            kitty=[c.to_dict() for c in self.kitty],
+            kitty=[CardDTO.model_construct(**c.to_dict()) for c in self.kitty],
             hand_sizes={s: len(self.hands[s]) for s in range(self.seats)},
             bids=self.bidding_manager.get_bids_dict(),
             current_highest=self.bidding_manager.current_highest,
             bid_winner=self.bidding_manager.bid_winner,
             bid_value=self.bidding_manager.bid_value,
-            points_by_seat=self.points_by_seat,
-            current_trick=current_trick_dict,
+            points_by_seat=dict(self.points_by_seat),
+            current_trick=(
+                {s: CardDTO.model_construct(**c) for s, c in current_trick_dict.items()}
+                if current_trick_dict is not None
+                else None
+            ),
             lead_suit=lead_suit,
             last_trick=last_trick_dict,
-            rounds_history=self.rounds_history,
+            rounds_history=list(self._rounds_history_dicts),
         )
+        self._public_state_cache = dto
         return dto
 
+    def get_public_state_dict(self) -> Dict[str, Any]:
+        # get_public_state().model_dump(), reused until the DTO is rebuilt.
+        # The dict is shared between callers, so copy it before adding keys.
+        dto = self.get_public_state()
+        if self._public_state_dump is None or self._public_state_dump[0] is not dto:
+            self._public_state_dump = (dto, dto.model_dump())
+        return self._public_state_dump[1]
+
     async def place_bid(self, seat: int, bid_cmd: BidCmd) -> Tuple[bool, str]:
         """
         Sequential bidding (safe):
@@ -208,6 +284,7 @@ class GameSession:
         """
         need_redeal = False
         async with self._lock:
+            self._public_state_cache = None
             if self.state != SessionState.BIDDING:
                 return False, "Not in bidding phase"
             if seat not in self.players:
@@ -229,19 +306,20 @@ class GameSession:
             if not success:
                 return False, msg
 
-            # debug log
-            logger.debug(
-                "bid_placed",
-                game_id=self.id,
-                seat=seat,
-                value=val,
-                current_highest=self.bidding_manager.current_highest,
-                bids_received=sorted(self.bidding_manager.bids_received),
-                turn_before=self.turn,
-            )
+            # debug log; skip building the payload when DEBUG is off
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "bid_placed",
+                    game_id=self.id,
+                    seat=seat,
+                    value=val,
+                    current_highest=self.bidding_manager.current_highest,
+                    bids_received=self.bidding_manager.get_bids_received(),
+                    turn_before=self.turn,
+                )
 
             # advance to next seat (clockwise)
-            self.turn = (self.turn - 1) % self.seats
+            self.turn = self._next_seat[self.turn]
 
             # Check if bidding round complete using BiddingManager
             if self.bidding_manager.is_complete():
@@ -267,13 +345,13 @@ class GameSession:
 
     async def choose_trump(self, seat: int, cmd: ChooseTrumpCmd) -> Tuple[bool, str]:
         async with self._lock:
+            self._public_state_cache = None
             if self.state != SessionState.CHOOSE_TRUMP:
                 return False, "Not waiting for trump"
             if seat != self.bidding_manager.bid_winner:
                 return False, "Only bid winner can choose trump"
             s = cmd.suit
-            valid_suits = [suit.value for suit in Suit]
-            if s not in valid_suits:
+            if s not in _VALID_SUITS:
                 return False, ErrorMessage.INVALID_SUIT
             self.trump = s
             self.trump_hidden = True
@@ -295,6 +373,7 @@ class GameSession:
         - Player must not have cards matching the lead suit
         """
         async with self._lock:
+            self._public_state_cache = None
             if self.state != SessionState.PLAY:
                 return False, "Not in play phase"
             if seat not in self.players:
@@ -322,8 +401,42 @@ class GameSession:
             )
             return True, f"Trump revealed: {self.trump}"
 
+    def _hand_suit_index(self, seat: int) -> _SuitIndex:
+        """
+        Get the suit counts/bitmask for a seat's hand.
+
+        The index is tied to the hand list it was built from, so it is rebuilt
+        whenever the hand is replaced (deal, restore) or changes length outside
+        of play_card.
+        """
+        hand = self.hands[seat]
+        entry = self._suit_index[seat]
+        if entry is None or entry.hand is not hand or entry.length != len(hand):
+            counts = [0] * len(SUITS)
+            mask = 0
+            for c in hand:
+                suit_idx = c.code >> 3
+                counts[suit_idx] += 1
+                mask |= 1 << suit_idx
+            entry = _SuitIndex(hand, len(hand), counts, mask)
+            self._suit_index[seat] = entry
+        return entry
+
+    def _discard_from_suit_index(self, seat: int, card: Card):
+        """Update a seat's suit index after `card` was removed from its hand."""
+        entry = self._suit_index[seat]
+        hand = self.hands[seat]
+        if entry is None or entry.hand is not hand or entry.length != len(hand) + 1:
+            # Stale index; it will be rebuilt on next use
+            return
+        suit_idx = card.code >> 3
+        entry.length = len(hand)
+        entry.counts[suit_idx] -= 1
+        if entry.counts[suit_idx] == 0:
+            entry.mask &= ~(1 << suit_idx)
+
     def _player_has_suit(self, seat: int, suit: str) -> bool:
-        return any(c.suit == suit for c in self.hands[seat])
+        return bool(self._hand_suit_index(seat).mask & (1 << SUIT_INDEX[suit]))
 
     def is_bot_seat(self, seat: int) -> bool:
         p = self.players.get(seat)
@@ -347,11 +460,7 @@ class GameSession:
             bid_value = ai_module.choose_bid_value(
                 hand,
                 min_bid=self.min_bid,
-                max_total=(
-                    GameConfig.MAX_BID_28
-                    if self.mode == GameMode.MODE_28.value
-                    else GameConfig.MAX_BID_56
-                ),
+                max_total=MAX_BID_BY_MODE.get(self.mode, GameConfig.MAX_BID_56),
                 current_highest=self.bidding_manager.current_highest,
                 mode="easy",
             )
@@ -379,15 +488,19 @@ class GameSession:
         Validate and apply a play. If trick completes, resolve and award points.
         """
         async with self._lock:
+            self._public_state_cache = None
             if self.state != SessionState.PLAY:
                 return False, "Not in play phase"
             if seat != self.turn:
                 return False, "Not your turn"
             # find card in player's hand
+            hand = self.hands[seat]
             card = None
-            for c in self.hands[seat]:
+            card_idx = -1
+            for i, c in enumerate(hand):
                 if c.uid == cmd.card_id:
                     card = c
+                    card_idx = i
                     break
             if card is None:
                 return False, "Card not in hand"
@@ -398,10 +511,12 @@ class GameSession:
                 return False, "Must follow suit if possible"
 
             # Save hand state before removing card (needed for reveal logic)
-            hand_before_play = list(self.hands[seat])
+            hand_before_play = list(hand)
 
-            # remove card
-            self.hands[seat].remove(card)
+            # remove card by the index found above (keeps hand order)
+            del hand[card_idx]
+            self.cards_remaining -= 1
+            self._discard_from_suit_index(seat, card)
             self.trick_manager.add_card_to_current_trick(seat, card)
 
             # Check if trump should be revealed using HiddenTrumpManager
@@ -428,10 +543,10 @@ class GameSession:
                 )
 
             # advance turn (clockwise)
-            self.turn = (self.turn - 1) % self.seats
+            self.turn = self._next_seat[self.turn]
 
             # if trick complete
-            if self.trick_manager.is_trick_complete(self.seats):
+            if self.trick_manager.is_trick_complete():
                 # Pass trump only if revealed; if hidden, pass None so no trump consideration
                 winner = self.trick_manager.complete_trick(
                     self.trump if not self.trump_hidden else None,
@@ -442,47 +557,60 @@ class GameSession:
                 self.leader = winner
                 self.turn = winner
                 # check end of round: all hands empty
-                if all(len(h) == 0 for h in self.hands):
+                if self.cards_remaining == 0:
                     self.state = SessionState.SCORING
                     # Save completed round to history
-                    round_data = {
-                        "round_number": len(self.rounds_history) + 1,
-                        "dealer": self.leader,
-                        "bid_winner": self.bidding_manager.bid_winner,
-                        "bid_value": self.bidding_manager.bid_value,
-                        "trump": self.trump,
-                        "captured_tricks": self.trick_manager.get_captured_tricks_for_serialization(),
-                        "points_by_seat": dict(self.points_by_seat),
-                        "team_scores": self.compute_scores(),
-                    }
-                    self.rounds_history.append(round_data)
+                    record = self._record_round(self.leader)
                     logger.info(
                         "round_completed_and_saved",
                         game_id=self.id,
-                        round_number=round_data["round_number"],
+                        round_number=record.round_number,
                         bid_winner=self.bidding_manager.bid_winner,
-                        team_scores=round_data["team_scores"],
+                        team_scores=record.team_scores,
                     )
                     # scoring will be computed by caller
                 return True, f"Trick complete. Winner: {winner} (+{pts} pts)"
             return True, "Card played"
 
-    def compute_scores(self) -> Dict[str, any]:
+    def _record_round(self, dealer: int) -> RoundRecord:
+        """Freeze the current round into a RoundRecord and append it to history."""
+        record = RoundRecord(
+            round_number=len(self.rounds_history) + 1,
+            dealer=dealer,
+            bid_winner=self.bidding_manager.bid_winner,
+            bid_value=self.bidding_manager.bid_value,
+            trump=self.trump,
+            captured_tricks=tuple(
+                self.trick_manager.get_captured_tricks_for_serialization()
+            ),
+            points_by_seat=tuple(
+                self.points_by_seat.get(seat, 0) for seat in range(self.seats)
+            ),
+            team_scores=self.compute_scores(),
+        )
+        self.rounds_history.append(record)
+        self._rounds_history_dicts.append(record.to_dict())
+        return record
+
+    def compute_scores(self) -> Dict[str, Any]:
         """
         Return structured scoring information: team points and bid outcome if any.
         teams: team0 = seats with even seat index, team1 = odd.
         """
-        team_points = {0: 0, 1: 0}
-        for seat, pts in self.points_by_seat.items():
-            team_idx = 0 if seat % 2 == 0 else 1
-            team_points[team_idx] += pts
+        pts = self.points_by_seat
+        team_points = {
+            0: sum(pts.get(seat, 0) for seat in range(0, self.seats, 2)),
+            1: sum(pts.get(seat, 0) for seat in range(1, self.seats, 2)),
+        }
         bid_outcome = None
-        if self.bidding_manager.bid_winner is not None and self.bidding_manager.bid_value is not None:
-            winning_team = 0 if self.bidding_manager.bid_winner % 2 == 0 else 1
-            success = team_points[winning_team] >= self.bidding_manager.bid_value
+        bid_winner = self.bidding_manager.bid_winner
+        bid_value = self.bidding_manager.bid_value
+        if bid_winner is not None and bid_value is not None:
+            winning_team = bid_winner & 1
+            success = team_points[winning_team] >= bid_value
             bid_outcome = {
-                "bid_winner": self.bidding_manager.bid_winner,
-                "bid_value": self.bidding_manager.bid_value,
+                "bid_winner": bid_winner,
+                "bid_value": bid_value,
                 "winning_team": winning_team,
                 "success": success,
             }
@@ -23,25 +23,31 @@ class TrickManager:
     - Provide trick state for serialization
     """
 
-    def __init__(self):
-        """Initialize empty trick state."""
+    def __init__(self, seats: int):
+        """Initialize empty trick state for a table of ``seats`` players."""
+        # fixed per session; a trick is complete once every seat has played
+        self.seats = seats
         self.current_trick: List[Tuple[int, Card]] = []
         self.last_trick: Optional[Tuple[int, List[Tuple[int, Card]]]] = None
-        self.captured_tricks: List[Tuple[int, List[Tuple[int, Card]]]] = []
+        # (winner, cards, points); points are fixed once the trick is captured
+        self.captured_tricks: List[Tuple[int, List[Tuple[int, Card]], int]] = []
+        # serialized captured tricks; rebuilt only after captured_tricks changes
+        self._captured_serialized: Optional[List[Dict]] = None
 
     def reset(self):
         """Reset all trick state (called when starting new round)."""
         self.current_trick = []
         self.last_trick = None
         self.captured_tricks = []
+        self._captured_serialized = None
 
     def add_card_to_current_trick(self, seat: int, card: Card):
         """Add a card to the current trick."""
         self.current_trick.append((seat, card))
 
-    def is_trick_complete(self, seats: int) -> bool:
+    def is_trick_complete(self) -> bool:
         """Check if current trick has all cards played."""
-        return len(self.current_trick) >= seats
+        return len(self.current_trick) >= self.seats
 
     def get_lead_suit(self) -> Optional[str]:
         """Get the lead suit of current trick, or None if no trick started."""
@@ -55,7 +61,7 @@ class TrickManager:
 
         Args:
             trump: Trump suit (None if hidden)
-            points_by_seat: Mutable dict to update with points
+            points_by_seat: Mutable dict to update with points (keyed by every seat)
 
         Returns:
             Seat number of trick winner
@@ -68,11 +74,14 @@ class TrickManager:
 
         # Calculate points
         pts = trick_points(self.current_trick)
-        points_by_seat[winner] = points_by_seat.get(winner, 0) + pts
+        points_by_seat[winner] += pts
 
-        # Save completed trick
-        self.last_trick = (winner, list(self.current_trick))
-        self.captured_tricks.append((winner, list(self.current_trick)))
+        # Save completed trick; the list is handed over, not copied, since
+        # current_trick is replaced below and captured tricks never change
+        trick_cards = self.current_trick
+        self.last_trick = (winner, trick_cards)
+        self.captured_tricks.append((winner, trick_cards, pts))
+        self._captured_serialized = None
 
         # Clear current trick for next round
         self.current_trick = []
@@ -113,14 +122,16 @@ class TrickManager:
         Returns:
             List of dicts with winner, cards, and points for each trick
         """
-        result = []
-        for winner_seat, trick_cards in self.captured_tricks:
-            result.append({
-                "winner": winner_seat,
-                "cards": [{"seat": s, "card": c.to_dict()} for s, c in trick_cards],
-                "points": trick_points(trick_cards)
-            })
-        return result
+        if self._captured_serialized is None:
+            self._captured_serialized = [
+                {
+                    "winner": winner_seat,
+                    "cards": [{"seat": s, "card": c.to_dict()} for s, c in trick_cards],
+                    "points": pts
+                }
+                for winner_seat, trick_cards, pts in self.captured_tricks
+            ]
+        return list(self._captured_serialized)
 
     def restore_from_state(
         self,
@@ -131,4 +142,8 @@ class TrickManager:
         """Restore trick state from saved game state."""
         self.current_trick = current_trick
         self.last_trick = last_trick
-        self.captured_tricks = captured_tricks
+        self.captured_tricks = [
+            (winner, trick_cards, trick_points(trick_cards))
+            for winner, trick_cards in captured_tricks
+        ]
+        self._captured_serialized = None
@@ -13,17 +13,11 @@ import sys
 from typing import Any
 
 import structlog
-from structlog.types import EventDict, Processor
+from structlog.types import FilteringBoundLogger, Processor
 
 
-def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """
-    Add application-specific context to all log entries.
-    This processor runs for every log call.
-    """
-    # Add application name for log aggregation
-    event_dict["app"] = "thurup-backend"
-    return event_dict
+# Static application name attached to every logger's initial context
+APP_NAME = "thurup-backend"
 
 
 def configure_logging(json_logs: bool = False, log_level: str = "INFO") -> None:
@@ -52,8 +46,6 @@ def configure_logging(json_logs: bool = False, log_level: str = "INFO") -> None:
         structlog.stdlib.add_logger_name,
         # Add timestamp
         structlog.processors.TimeStamper(fmt="iso"),
-        # Add application context
-        add_app_context,
         # Add stack info for exceptions
         structlog.processors.StackInfoRenderer(),
         # Format exceptions
@@ -69,17 +61,18 @@ def configure_logging(json_logs: bool = False, log_level: str = "INFO") -> None:
         # Development: Pretty console output with colors
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
 
-    # Configure structlog
+    # Configure structlog; the filtering wrapper drops calls below the level
+    # before any event dict is built or processor runs
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str = __name__) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str = __name__) -> FilteringBoundLogger:
     """
     Get a configured logger instance.
 
@@ -93,7 +86,8 @@ def get_logger(name: str = __name__) -> structlog.stdlib.BoundLogger:
         logger = get_logger(__name__)
         logger.info("player_joined", game_id=game_id, player_name=name, seat=seat)
     """
-    return structlog.get_logger(name)
+    # The app name is bound once here instead of by a per-call processor
+    return structlog.get_logger(name, app=APP_NAME)
 
 
 # Context manager for request-scoped logging
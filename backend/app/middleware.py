@@ -2,7 +2,7 @@
 FastAPI middleware for request tracking and logging.
 """
 
-import uuid
+import secrets
 from typing import Callable
 
 import structlog
@@ -15,21 +15,21 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     Middleware that adds a unique request ID to each request for log correlation.
 
     The request ID is:
-    - Generated as a UUID for each request
+    - Generated as 32 random hex characters for each request
     - Added to response headers as X-Request-ID
     - Bound to structlog context for automatic inclusion in all logs
     - Accessible via request.state.request_id
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        # Generate unique request ID (128 random bits, no UUID object/formatting)
+        request_id = secrets.token_hex(16)
 
         # Store in request state for access in route handlers
         request.state.request_id = request_id
 
         # Bind to structlog context so all logs in this request include it
-        structlog.contextvars.bind_contextvars(request_id=request_id)
+        tokens = structlog.contextvars.bind_contextvars(request_id=request_id)
 
         try:
             # Process request
@@ -40,5 +40,5 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
             return response
         finally:
-            # Clean up context
-            structlog.contextvars.unbind_contextvars("request_id")
+            # Restore the previous context value via the bind tokens
+            structlog.contextvars.reset_contextvars(**tokens)
@@ -1,8 +1,7 @@
 # backend/app/models.py
-from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
 
 from app.constants import (
     BidValue,
@@ -13,6 +12,28 @@ from app.constants import (
     Suit,
 )
 
+# Allowed values, built once for the validators below
+_VALID_SUITS = frozenset(s.value for s in Suit)
+_RANK_VALUES = tuple(r.value for r in CardRank)  # enum order, for error messages
+_VALID_RANKS = frozenset(_RANK_VALUES)
+_VALID_MODES = frozenset(m.value for m in GameMode)
+
+
+def _check_bid_value(v: Optional[int]) -> Optional[int]:
+    """Allow None/-1 (pass) or a bid within the global min/max range."""
+    if v is None or v == BidValue.PASS:
+        return v
+    if v < GameConfig.MIN_BID_DEFAULT:
+        raise ValueError(f"Bid must be >= {GameConfig.MIN_BID_DEFAULT}")
+    if v > GameConfig.MAX_BID_56:  # use max possible bid
+        raise ValueError(f"Bid cannot exceed {GameConfig.MAX_BID_56}")
+    return v
+
+
+# Bid value shared by the REST and WebSocket bid models; pydantic-core coerces
+# to int before the single after-validator runs
+BidValueField = Annotated[Optional[int], AfterValidator(_check_bid_value)]
+
 
 class CardDTO(BaseModel):
     """Data transfer object for a playing card."""
@@ -24,17 +45,15 @@ class CardDTO(BaseModel):
     @field_validator("suit")
     @classmethod
     def validate_suit(cls, v: str) -> str:
-        valid_suits = [s.value for s in Suit]
-        if v not in valid_suits:
+        if v not in _VALID_SUITS:
             raise ValueError(ErrorMessage.INVALID_SUIT)
         return v
 
     @field_validator("rank")
     @classmethod
     def validate_rank(cls, v: str) -> str:
-        valid_ranks = [r.value for r in CardRank]
-        if v not in valid_ranks:
-            raise ValueError(f"Invalid rank (must be one of {', '.join(valid_ranks)})")
+        if v not in _VALID_RANKS:
+            raise ValueError(f"Invalid rank (must be one of {', '.join(_RANK_VALUES)})")
         return v
 
 
@@ -55,6 +74,18 @@ class PlayerInfo(BaseModel):
 
 
 class GameStateDTO(BaseModel):
+    """
+    Public game state sent to clients.
+
+    This is an output model built from trusted session state, so
+    GameSession.get_public_state() uses model_construct() (nested cards as
+    CardDTO.model_construct()) and skips validation. Validate with the
+    normal constructor only if it is ever built from untrusted input.
+    """
+
+    # Instances are cached on the session and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     game_id: str
     short_code: Optional[str] = None
     mode: str
@@ -86,20 +117,7 @@ class GameStateDTO(BaseModel):
 class BidCmd(BaseModel):
     """Command to place a bid during bidding phase."""
 
-    value: Optional[int] = Field(None, description="Bid value (None or -1 for pass)")
-
-    @field_validator("value")
-    @classmethod
-    def validate_bid(cls, v: Optional[int]) -> Optional[int]:
-        if v is None or v == BidValue.PASS:
-            return v
-        if not isinstance(v, int):
-            raise ValueError("Bid must be an integer or None/−1 for pass")
-        if v < GameConfig.MIN_BID_DEFAULT:
-            raise ValueError(f"Bid must be >= {GameConfig.MIN_BID_DEFAULT}")
-        if v > GameConfig.MAX_BID_56:  # use max possible bid
-            raise ValueError(f"Bid cannot exceed {GameConfig.MAX_BID_56}")
-        return v
+    value: BidValueField = Field(None, description="Bid value (None or -1 for pass)")
 
 
 class ChooseTrumpCmd(BaseModel):
@@ -110,8 +128,7 @@ class ChooseTrumpCmd(BaseModel):
     @field_validator("suit")
     @classmethod
     def validate_suit(cls, v: str) -> str:
-        valid_suits = [s.value for s in Suit]
-        if v not in valid_suits:
+        if v not in _VALID_SUITS:
             raise ValueError(ErrorMessage.INVALID_SUIT)
         return v
 
@@ -144,7 +161,7 @@ class CreateGameRequest(BaseModel):
     @field_validator("mode")
     @classmethod
     def validate_mode(cls, v: str) -> str:
-        if v not in (GameMode.MODE_28.value, GameMode.MODE_56.value):
+        if v not in _VALID_MODES:
             raise ValueError(ErrorMessage.INVALID_MODE)
         return v
 
@@ -192,6 +209,8 @@ class GameActionRequest(BaseModel):
 class WSIdentifyPayload(BaseModel):
     """Payload for WebSocket identify message."""
 
+    model_config = ConfigDict(frozen=True)
+
     seat: Optional[int] = Field(None, ge=0, lt=GameConfig.MAX_SEATS, description="Player seat number")
     player_id: Optional[str] = Field(None, description="Player identifier")
 
@@ -199,34 +218,24 @@ class WSIdentifyPayload(BaseModel):
 class WSPlaceBidPayload(BaseModel):
     """Payload for WebSocket place_bid message."""
 
-    seat: int = Field(..., ge=0, lt=GameConfig.MAX_SEATS, description="Player seat number")
-    value: Optional[int] = Field(None, description="Bid value (None or -1 for pass)")
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator("value")
-    @classmethod
-    def validate_bid(cls, v: Optional[int]) -> Optional[int]:
-        if v is None or v == BidValue.PASS:
-            return v
-        if not isinstance(v, int):
-            raise ValueError("Bid must be an integer or None/−1 for pass")
-        if v < GameConfig.MIN_BID_DEFAULT:
-            raise ValueError(f"Bid must be >= {GameConfig.MIN_BID_DEFAULT}")
-        if v > GameConfig.MAX_BID_56:
-            raise ValueError(f"Bid cannot exceed {GameConfig.MAX_BID_56}")
-        return v
+    seat: int = Field(..., ge=0, lt=GameConfig.MAX_SEATS, description="Player seat number")
+    value: BidValueField = Field(None, description="Bid value (None or -1 for pass)")
 
 
 class WSChooseTrumpPayload(BaseModel):
     """Payload for WebSocket choose_trump message."""
 
+    model_config = ConfigDict(frozen=True)
+
     seat: int = Field(..., ge=0, lt=GameConfig.MAX_SEATS, description="Player seat number")
     suit: str = Field(..., description="Trump suit (♠, ♥, ♦, or ♣)")
 
     @field_validator("suit")
     @classmethod
     def validate_suit(cls, v: str) -> str:
-        valid_suits = [s.value for s in Suit]
-        if v not in valid_suits:
+        if v not in _VALID_SUITS:
             raise ValueError(ErrorMessage.INVALID_SUIT)
         return v
 
@@ -234,6 +243,8 @@ class WSChooseTrumpPayload(BaseModel):
 class WSPlayCardPayload(BaseModel):
     """Payload for WebSocket play_card message."""
 
+    model_config = ConfigDict(frozen=True)
+
     seat: int = Field(..., ge=0, lt=GameConfig.MAX_SEATS, description="Player seat number")
     card_id: str = Field(..., min_length=1, description="Unique card identifier to play")
 
@@ -241,6 +252,8 @@ class WSPlayCardPayload(BaseModel):
 class WSRevealTrumpPayload(BaseModel):
     """Payload for WebSocket reveal_trump message."""
 
+    model_config = ConfigDict(frozen=True)
+
     seat: int = Field(..., ge=0, lt=GameConfig.MAX_SEATS, description="Player seat number")
 
 
@@ -10,15 +10,25 @@ from typing import Dict, Optional
 from fastapi import HTTPException
 
 from app.constants import ErrorMessage
-from app.db.config import get_db
+from app.db.config import AsyncSessionLocal
 from app.db.repository import GameRepository
 from app.game.session import GameSession
+from app.utils.shortcode import validate_short_code
+
+
+def _looks_like_uuid(identifier: str) -> bool:
+    """Cheap shape check for a hyphenated UUID string (game IDs are uuid4)."""
+    return (
+        len(identifier) == 36
+        and identifier[8] == identifier[13] == identifier[18] == identifier[23] == "-"
+    )
 
 
 async def resolve_game_identifier(
     identifier: str,
     sessions: Dict[str, GameSession],
-    raise_on_not_found: bool = False
+    raise_on_not_found: bool = False,
+    short_code_index: Optional[Dict[str, str]] = None,
 ) -> Optional[str]:
     """
     Resolve game identifier (UUID or short code) to game UUID.
@@ -29,15 +39,18 @@ async def resolve_game_identifier(
 
     Resolution order:
     1. Check in-memory sessions by UUID key
-    2. Check in-memory sessions by short_code attribute
-    3. Check database by UUID
-    4. Check database by short_code
+    2. Check in-memory sessions by short_code (index lookup when provided)
+    3. Check database by UUID (skipped for generated short codes)
+    4. Check database by short_code (skipped for UUID-shaped identifiers)
 
     Args:
         identifier: Either a game UUID or short code (e.g., "royal-turtle-65")
         sessions: Dictionary of active game sessions
         raise_on_not_found: If True, raises HTTPException when not found;
                           if False, returns the original identifier
+        short_code_index: Optional short_code -> game_id mapping for the
+                          sessions (see GameServer.get_short_code_index);
+                          without it the sessions are scanned
 
     Returns:
         Game UUID if found, None or original identifier otherwise
@@ -60,26 +73,38 @@ async def resolve_game_identifier(
     if identifier in sessions:
         return identifier
 
-    # Check in-memory sessions by short_code attribute
-    for game_id, session in sessions.items():
-        if session.short_code == identifier:
+    # Check in-memory sessions by short_code
+    if short_code_index is not None:
+        game_id = short_code_index.get(identifier)
+        if game_id in sessions:
             return game_id
-
-    # Check database
-    async for db in get_db():
+    else:
+        for game_id, session in sessions.items():
+            if session.short_code == identifier:
+                return game_id
+
+    # Check database. Generated short codes never look like UUIDs and game IDs
+    # never look like generated short codes, so a recognised shape needs only
+    # one query; anything else (custom IDs, fallback codes) tries both.
+    is_uuid = _looks_like_uuid(identifier)
+    is_short_code = not is_uuid and validate_short_code(identifier)
+
+    # A plain session context (not get_db()): returning from inside an
+    # "async for" would leave the generator's cleanup to event loop teardown
+    async with AsyncSessionLocal() as db:
         repo = GameRepository(db)
 
         # Try UUID lookup
-        game = await repo.get_game(identifier)
-        if game:
-            return game.id
+        if not is_short_code:
+            game = await repo.get_game(identifier)
+            if game:
+                return game.id
 
         # Try short code lookup
-        game = await repo.get_game_by_short_code(identifier)
-        if game:
-            return game.id
-
-        break  # Exit after one iteration
+        if not is_uuid:
+            game = await repo.get_game_by_short_code(identifier)
+            if game:
+                return game.id
 
     # Handle not found case
     if raise_on_not_found:
@@ -5,10 +5,11 @@ Generates memorable 2-3 word codes for game IDs (e.g., "blue-tiger-42").
 """
 
 import random
+import re
 from typing import Set
 
 # Curated word lists for memorable codes
-ADJECTIVES = [
+ADJECTIVES = (
     "happy", "clever", "brave", "bright", "swift",
     "calm", "bold", "wise", "quick", "proud",
     "sharp", "cool", "warm", "free", "kind",
@@ -17,9 +18,9 @@ ADJECTIVES = [
     "smart", "witty", "jolly", "merry", "noble",
     "royal", "grand", "prime", "vital", "zesty",
     "peppy", "perky", "chipper", "bouncy", "lively",
-]
+)
 
-NOUNS = [
+NOUNS = (
     "tiger", "eagle", "dragon", "phoenix", "falcon",
     "wolf", "bear", "lion", "hawk", "panther",
     "fox", "owl", "raven", "cobra", "lynx",
@@ -28,7 +29,21 @@ NOUNS = [
     "dolphin", "whale", "shark", "octopus", "mantis",
     "spider", "beetle", "hornet", "wasp", "cricket",
     "turtle", "tortoise", "gecko", "iguana", "newt",
-]
+)
+
+# Codes are decoded from a single random index into the full code space
+_NUMBER_MIN = 10
+_NUMBER_COUNT = 90  # 10..99
+_NUM_NOUNS = len(NOUNS)
+_CODE_SPACE = len(ADJECTIVES) * _NUM_NOUNS * _NUMBER_COUNT
+
+# Validation: format gate (two-digit number 10-99), then set membership
+_ADJECTIVES_SET = frozenset(ADJECTIVES)
+_NOUNS_SET = frozenset(NOUNS)
+_SHORT_CODE_RE = re.compile(r"([a-z]+)-([a-z]+)-[1-9][0-9]")
+
+# Normalization: any run of whitespace, underscores or hyphens becomes one hyphen
+_SEPARATOR_RUN_RE = re.compile(r"[\s_-]+")
 
 
 def generate_short_code(existing_codes: Set[str] = None) -> str:
@@ -46,13 +61,14 @@ def generate_short_code(existing_codes: Set[str] = None) -> str:
     if existing_codes is None:
         existing_codes = set()
 
-    max_attempts = 100
+    # No point drawing if every code is already taken
+    max_attempts = 100 if len(existing_codes) < _CODE_SPACE else 0
     for _ in range(max_attempts):
-        adjective = random.choice(ADJECTIVES)
-        noun = random.choice(NOUNS)
-        number = random.randint(10, 99)
+        # One RNG draw, decoded into (adjective, noun, number) indices
+        rest, number_idx = divmod(random.randrange(_CODE_SPACE), _NUMBER_COUNT)
+        adj_idx, noun_idx = divmod(rest, _NUM_NOUNS)
 
-        code = f"{adjective}-{noun}-{number}"
+        code = f"{ADJECTIVES[adj_idx]}-{NOUNS[noun_idx]}-{_NUMBER_MIN + number_idx}"
 
         if code not in existing_codes:
             return code
@@ -76,30 +92,13 @@ def validate_short_code(code: str) -> bool:
     if not code:
         return False
 
-    parts = code.split("-")
-
-    # Should have 3 parts: adjective-noun-number
-    if len(parts) != 3:
+    # Shape adjective-noun-number, with the number between 10 and 99
+    match = _SHORT_CODE_RE.fullmatch(code)
+    if match is None:
         return False
 
-    adjective, noun, number_str = parts
-
-    # Check if parts are valid
-    if adjective not in ADJECTIVES:
-        return False
-
-    if noun not in NOUNS:
-        return False
-
-    # Check if number is valid (10-99)
-    try:
-        number = int(number_str)
-        if number < 10 or number > 99:
-            return False
-    except ValueError:
-        return False
-
-    return True
+    adjective, noun = match.groups()
+    return adjective in _ADJECTIVES_SET and noun in _NOUNS_SET
 
 
 def normalize_short_code(code: str) -> str:
@@ -112,12 +111,5 @@ def normalize_short_code(code: str) -> str:
     Returns:
         Normalized code string
     """
-    # Replace spaces with hyphens, convert to lowercase
-    normalized = code.lower().strip()
-    normalized = normalized.replace(" ", "-").replace("_", "-")
-
-    # Remove multiple consecutive hyphens
-    while "--" in normalized:
-        normalized = normalized.replace("--", "-")
-
-    return normalized
+    # Convert to lowercase, then collapse separator runs in a single pass
+    return _SEPARATOR_RUN_RE.sub("-", code.lower().strip())
@@ -4,30 +4,54 @@ Shared pytest configuration for all tests.
 Manages test database lifecycle and provides shared fixtures.
 """
 
-import asyncio
+import base64
 import os
 import pytest
 import pytest_asyncio
-from pathlib import Path
 
-from app.db.config import init_db, close_db, engine
-from sqlmodel import SQLModel
+from sqlalchemy import event
+
+# Keep the test database in memory; must be set before app.db.config is
+# imported, since the engine is created at import time
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+
+from app.db.config import AsyncSessionLocal, init_db, close_db, engine  # noqa: E402
+from app.api.v1.persistence_integration import delete_game_from_db  # noqa: E402
+from app.core.game_server import get_game_server  # noqa: E402
 
 
 # Set testing environment variable
 os.environ["TESTING"] = "true"
 
+# Default admin credentials from admin.py, encoded once
+ADMIN_AUTH = {"Authorization": f"Basic {base64.b64encode(b'admin:changeme').decode('utf-8')}"}
 
-@pytest.fixture(scope="session")
-def event_loop():
+
+# pysqlite defers BEGIN until the first write and commits around SAVEPOINTs,
+# so the per-test outer transaction below would not actually hold anything.
+# Let SQLAlchemy emit BEGIN itself (the recipe from the SQLAlchemy SQLite docs).
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def pytest_collection_modifyitems(items):
     """
-    Create an event loop for the entire test session.
+    Run every async test on the session-scoped event loop.
 
-    This prevents "Event loop is closed" errors in async tests.
+    The engine (and its pooled aiosqlite connection) is created by the
+    session fixtures below, so sharing their loop avoids per-test loops and
+    the "Event loop is closed" errors they cause.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
@@ -36,42 +60,71 @@ async def setup_test_database():
     Setup test database before all tests and tear down after.
 
     This fixture:
-    - Creates the test database file (thurup_test.db)
-    - Initializes all tables
+    - Initializes all tables in the in-memory test database
     - Yields for tests to run
-    - Cleans up the database after all tests complete
+    - Closes the connection (which discards the database) afterwards
     """
-    # Get test database path
-    test_db_path = Path("thurup_test.db")
-
-    # Remove existing test database if it exists
-    if test_db_path.exists():
-        test_db_path.unlink()
-
     # Initialize database tables
     await init_db()
 
     yield
 
-    # Cleanup: close connections and remove test database
+    # Cleanup: close connections
     await close_db()
-    if test_db_path.exists():
-        test_db_path.unlink()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_connection(setup_test_database):
+    """
+    One connection for the whole session, checked out once.
+
+    Tests never hold it between them: clean_tables runs each test in its own
+    transaction on it.
+    """
+    async with engine.connect() as conn:
+        yield conn
 
 
 @pytest_asyncio.fixture(autouse=True)
-async def clean_tables():
+async def clean_tables(db_connection):
     """
-    Clean all tables between tests for isolation.
+    Roll back everything a test wrote, for isolation.
 
-    This fixture runs before each test to ensure a clean slate.
+    Each test runs inside one outer transaction on the session connection.
+    AsyncSessionLocal (and get_db, which uses it) is bound to that connection
+    for the test, and a session commit only releases a SAVEPOINT. Rolling back
+    the outer transaction afterwards discards all rows without touching the
+    schema.
     """
-    # This runs before each test
-    yield
+    session_options = dict(AsyncSessionLocal.kw)
+    trans = await db_connection.begin()
+    AsyncSessionLocal.configure(bind=db_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield
+    finally:
+        AsyncSessionLocal.kw = session_options
+        await trans.rollback()
+
 
-    # After each test, truncate all tables (but keep schema)
-    async with engine.begin() as conn:
-        # Drop all tables
-        await conn.run_sync(SQLModel.metadata.drop_all)
-        # Recreate all tables
-        await conn.run_sync(SQLModel.metadata.create_all)
+@pytest.fixture(scope="session")
+def admin_auth():
+    """Admin authentication headers with the default credentials."""
+    return ADMIN_AUTH
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def committed_games():
+    """
+    Games shared by a module's read-only tests; append their game_ids here.
+
+    This is the one exception to clean_tables' isolation: module-scoped
+    fixtures are set up before the per-test transaction starts, so the rows
+    they write are committed and visible to every test in the module. Tests
+    that change a game must create their own. The registered games are
+    removed from memory and the database when the module finishes.
+    """
+    game_ids = []
+    yield game_ids
+    for game_id in game_ids:
+        get_game_server().remove_session(game_id)
+        await delete_game_from_db(game_id)
@@ -12,50 +12,134 @@ Tests all admin endpoints with various scenarios:
 - Error handling
 """
 
+import asyncio
 import base64
+import uuid
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
+from app.api.v1.persistence_integration import save_game_state
+from app.core.game_server import get_game_server
+from app.db.config import AsyncSessionLocal
+from app.db.models import GameModel
+from app.game.session import GameSession
 from app.main import app
+from app.models import PlayerInfo
+from app.utils import generate_short_code
 
 
-@pytest.fixture
-def client():
-    """Test client for REST endpoints."""
-    return TestClient(app)
+def _basic_auth(credentials: bytes) -> dict:
+    """Build a Basic auth header for the given b"user:password"."""
+    return {"Authorization": f"Basic {base64.b64encode(credentials).decode('utf-8')}"}
+
 
+# Auth headers are constant, so encode them once at import; the valid one
+# is the admin_auth fixture in conftest.py
+_INVALID_AUTH = _basic_auth(b"admin:wrongpassword")
+_WRONG_USER_AUTH = _basic_auth(b"wronguser:changeme")
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Test client for REST endpoints, shared by every test in the session.
 
-@pytest.fixture
-def admin_auth():
-    """Admin authentication headers with correct credentials."""
-    credentials = base64.b64encode(b"admin:changeme").decode("utf-8")
-    return {"Authorization": f"Basic {credentials}"}
+    Not entered as a context manager: the app's lifespan would create and
+    then dispose of the test database engine, which conftest.py owns.
+    """
+    return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_auth():
     """Invalid authentication headers."""
-    credentials = base64.b64encode(b"admin:wrongpassword").decode("utf-8")
-    return {"Authorization": f"Basic {credentials}"}
+    return _INVALID_AUTH
+
 
+async def _create_sample_game(players: int = 2) -> str:
+    """
+    Create a game with the given number of human players; returns its game_id.
 
-@pytest.fixture
-def sample_game(client):
-    """Create a sample game for testing."""
-    response = client.post("/api/v1/game/create", json={"mode": "28", "seats": 4})
-    game_id = response.json()["game_id"]
+    Builds the session in-process, as the create and join endpoints do,
+    instead of going through HTTP: the tests only need a seeded game.
+    """
+    server = get_game_server()
+    game = GameSession(
+        mode="28", seats=4, short_code=generate_short_code(set(server.get_short_code_index()))
+    )
+    server.add_session(game.id, game)
+    await save_game_state(game.id, reason="create")
 
     # Join some players
-    for i in range(2):
-        client.post(
-            f"/api/v1/game/{game_id}/join",
-            json={"name": f"Player{i}", "is_bot": False}
+    for i in range(players):
+        await game.add_player(
+            PlayerInfo(player_id=str(uuid.uuid4()), name=f"Player{i}", is_bot=False)
+        )
+        await save_game_state(game.id, reason="player_join")
+
+    return game.id
+
+
+async def _seed_games(n: int) -> None:
+    """Insert n lobby games straight into the database in one commit."""
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            [
+                GameModel(
+                    id=str(uuid.uuid4()),
+                    short_code=f"seed-game-{i}",
+                    mode="28",
+                    seats=4,
+                    min_bid=14,
+                    hidden_trump_mode="on_first_nonfollow",
+                    two_decks_for_56=False,
+                    state="lobby",
+                )
+                for i in range(n)
+            ]
         )
+        await db.commit()
 
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def readonly_sample_game(committed_games):
+    """A sample game created once for the module, for tests that only read it."""
+    game_id = await _create_sample_game()
+    committed_games.append(game_id)
     return game_id
 
 
+@pytest.fixture(scope="module")
+def database_stats_snapshot(client, admin_auth, readonly_sample_game):
+    """One GET /admin/database/stats response, parsed, for the read-only stats tests."""
+    response = client.get("/api/v1/admin/database/stats", headers=admin_auth)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+def game_history_snapshot(client, admin_auth, readonly_sample_game):
+    """One GET /admin/games/history response, parsed, for the read-only history tests."""
+    response = client.get("/api/v1/admin/games/history", headers=admin_auth)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest_asyncio.fixture
+async def full_sample_game(client, admin_auth):
+    """A started four-player game (hands dealt); its session is deleted afterwards."""
+    game_id = await _create_sample_game(players=4)
+    await get_game_server().get_session(game_id).start_round(dealer=0)
+    await save_game_state(game_id, reason="round_start")
+
+    yield game_id
+
+    client.delete(f"/api/v1/admin/sessions/{game_id}", headers=admin_auth)
+
+
 class TestAdminAuthentication:
     """Tests for admin authentication."""
 
@@ -77,32 +161,31 @@ class TestAdminAuthentication:
 
     def test_sessions_with_invalid_username(self, client):
         """Test invalid username in basic auth."""
-        credentials = base64.b64encode(b"wronguser:changeme").decode("utf-8")
-        headers = {"Authorization": f"Basic {credentials}"}
-
-        response = client.get("/api/v1/admin/sessions", headers=headers)
+        response = client.get("/api/v1/admin/sessions", headers=_WRONG_USER_AUTH)
         assert response.status_code == 401
 
-    def test_all_endpoints_require_auth(self, client):
-        """Test that all admin endpoints require authentication."""
-        endpoints = [
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
             "/api/v1/admin/health",
             "/api/v1/admin/sessions",
             "/api/v1/admin/connections",
             "/api/v1/admin/database/stats",
             "/api/v1/admin/games/history",
-        ]
-
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert response.status_code == 401, f"{endpoint} should require auth"
+        ],
+    )
+    def test_endpoint_requires_auth(self, client, endpoint):
+        """Test that each admin endpoint requires authentication."""
+        response = client.get(endpoint)
+        assert response.status_code == 401, f"{endpoint} should require auth"
 
 
 class TestServerHealth:
     """Tests for GET /admin/health endpoint."""
 
-    def test_health_check_structure(self, client, admin_auth):
-        """Test health check response structure."""
+    @pytest.mark.smoke
+    def test_health_comprehensive(self, client, admin_auth, readonly_sample_game):
+        """Test health check structure, values and active sessions from one response."""
         response = client.get("/api/v1/admin/health", headers=admin_auth)
         assert response.status_code == 200
 
@@ -122,56 +205,25 @@ class TestServerHealth:
         assert isinstance(health["running_bot_tasks"], int)
         assert isinstance(health["database_connected"], bool)
 
-    def test_health_status_values(self, client, admin_auth):
-        """Test that health status is healthy or degraded."""
-        response = client.get("/api/v1/admin/health", headers=admin_auth)
-        health = response.json()
-        assert health["status"] in ["healthy", "degraded"]
-
-    def test_health_with_active_game(self, client, admin_auth, sample_game):
-        """Test health check reflects active sessions."""
-        response = client.get("/api/v1/admin/health", headers=admin_auth)
-        health = response.json()
-
-        # Should show at least 1 in-memory session
-        assert health["in_memory_sessions"] >= 1
-
-    def test_health_database_connected(self, client, admin_auth):
-        """Test database connection check."""
-        response = client.get("/api/v1/admin/health", headers=admin_auth)
-        health = response.json()
-
         # In test environment, database should be connected
         assert health["database_connected"] is True
         assert health["status"] == "healthy"
 
+        # Should show at least 1 in-memory session (the sample game)
+        assert health["in_memory_sessions"] >= 1
+
 
 class TestListSessions:
     """Tests for GET /admin/sessions endpoint."""
 
-    def test_list_sessions_empty(self, client, admin_auth):
-        """Test listing sessions when none exist."""
+    @pytest.mark.smoke
+    def test_sessions_comprehensive(self, client, admin_auth, readonly_sample_game):
+        """Test session list structure, lookup and player count from one response."""
         response = client.get("/api/v1/admin/sessions", headers=admin_auth)
         assert response.status_code == 200
         sessions = response.json()
         assert isinstance(sessions, list)
 
-    def test_list_sessions_with_game(self, client, admin_auth, sample_game):
-        """Test listing sessions with active game."""
-        response = client.get("/api/v1/admin/sessions", headers=admin_auth)
-        assert response.status_code == 200
-        sessions = response.json()
-
-        # Should find our sample game
-        assert len(sessions) >= 1
-        found = any(s["game_id"] == sample_game for s in sessions)
-        assert found
-
-    def test_list_sessions_response_structure(self, client, admin_auth, sample_game):
-        """Test that session info has correct structure."""
-        response = client.get("/api/v1/admin/sessions", headers=admin_auth)
-        sessions = response.json()
-
         for session in sessions:
             assert "game_id" in session
             assert "short_code" in session
@@ -183,21 +235,18 @@ class TestListSessions:
             assert "connected_seats" in session
             assert "has_bot_task" in session
 
-    def test_list_sessions_player_count(self, client, admin_auth, sample_game):
-        """Test that player count is accurate."""
-        response = client.get("/api/v1/admin/sessions", headers=admin_auth)
-        sessions = response.json()
-
-        game_session = next(s for s in sessions if s["game_id"] == sample_game)
+        # Should find our sample game
+        game_session = next(s for s in sessions if s["game_id"] == readonly_sample_game)
         assert game_session["player_count"] == 2  # We added 2 players in fixture
 
 
 class TestSessionDetail:
     """Tests for GET /admin/sessions/{game_id}/detail endpoint."""
 
-    def test_get_session_detail_success(self, client, admin_auth, sample_game):
+    @pytest.mark.smoke
+    def test_get_session_detail_success(self, client, admin_auth, readonly_sample_game):
         """Test getting detailed session info."""
-        response = client.get(f"/api/v1/admin/sessions/{sample_game}/detail", headers=admin_auth)
+        response = client.get(f"/api/v1/admin/sessions/{readonly_sample_game}/detail", headers=admin_auth)
         assert response.status_code == 200
 
         detail = response.json()
@@ -208,7 +257,7 @@ class TestSessionDetail:
         assert "connected_seats" in detail
         assert "has_bot_task" in detail
 
-        assert detail["game_id"] == sample_game
+        assert detail["game_id"] == readonly_sample_game
 
     def test_get_session_detail_not_found(self, client, admin_auth):
         """Test getting detail for non-existent session."""
@@ -216,18 +265,14 @@ class TestSessionDetail:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_session_detail_includes_all_hands(self, client, admin_auth, sample_game):
+    def test_get_session_detail_includes_all_hands(self, client, admin_auth, full_sample_game):
         """Test that admin can see all player hands."""
-        # Start the game so players have hands
-        client.post(f"/api/v1/game/{sample_game}/join", json={"name": "Player2", "is_bot": False})
-        client.post(f"/api/v1/game/{sample_game}/join", json={"name": "Player3", "is_bot": False})
-        client.post(f"/api/v1/game/{sample_game}/start", json={"dealer": 0})
-
-        response = client.get(f"/api/v1/admin/sessions/{sample_game}/detail", headers=admin_auth)
+        response = client.get(f"/api/v1/admin/sessions/{full_sample_game}/detail", headers=admin_auth)
         detail = response.json()
 
         # all_hands should be a dict mapping seat to cards
         assert isinstance(detail["all_hands"], dict)
+        assert len(detail["all_hands"]) == 4
 
 
 class TestListConnections:
@@ -256,31 +301,27 @@ class TestListConnections:
 class TestDatabaseStats:
     """Tests for GET /admin/database/stats endpoint."""
 
-    def test_database_stats_structure(self, client, admin_auth):
+    @pytest.mark.smoke
+    def test_database_stats_structure(self, database_stats_snapshot):
         """Test database stats response structure."""
-        response = client.get("/api/v1/admin/database/stats", headers=admin_auth)
-        assert response.status_code == 200
-
-        stats = response.json()
+        stats = database_stats_snapshot
         assert "total_games" in stats
         assert "total_players" in stats
         assert "total_snapshots" in stats
         assert "db_size_bytes" in stats
 
-    def test_database_stats_values(self, client, admin_auth):
+    def test_database_stats_values(self, database_stats_snapshot):
         """Test that database stats contain valid values."""
-        response = client.get("/api/v1/admin/database/stats", headers=admin_auth)
-        stats = response.json()
+        stats = database_stats_snapshot
 
         # All counts should be non-negative
         assert stats["total_games"] >= 0
         assert stats["total_players"] >= 0
         assert stats["total_snapshots"] >= 0
 
-    def test_database_stats_with_game(self, client, admin_auth, sample_game):
+    def test_database_stats_with_game(self, database_stats_snapshot):
         """Test stats reflect created games."""
-        response = client.get("/api/v1/admin/database/stats", headers=admin_auth)
-        stats = response.json()
+        stats = database_stats_snapshot
 
         # Should have at least 1 game and 2 players
         assert stats["total_games"] >= 1
@@ -290,9 +331,9 @@ class TestDatabaseStats:
 class TestForceSaveSession:
     """Tests for POST /admin/sessions/{game_id}/save endpoint."""
 
-    def test_force_save_success(self, client, admin_auth, sample_game):
+    def test_force_save_success(self, client, admin_auth, full_sample_game):
         """Test manually saving a session."""
-        response = client.post(f"/api/v1/admin/sessions/{sample_game}/save", headers=admin_auth)
+        response = client.post(f"/api/v1/admin/sessions/{full_sample_game}/save", headers=admin_auth)
         assert response.status_code == 200
 
         result = response.json()
@@ -354,9 +395,9 @@ class TestDeleteSession:
 class TestKillBotTask:
     """Tests for POST /admin/sessions/{game_id}/kill_bots endpoint."""
 
-    def test_kill_bot_task_not_found(self, client, admin_auth, sample_game):
+    def test_kill_bot_task_not_found(self, client, admin_auth, full_sample_game):
         """Test killing bot task when none is running."""
-        response = client.post(f"/api/v1/admin/sessions/{sample_game}/kill_bots", headers=admin_auth)
+        response = client.post(f"/api/v1/admin/sessions/{full_sample_game}/kill_bots", headers=admin_auth)
         assert response.status_code == 404
         assert "No bot task" in response.json()["detail"]
 
@@ -396,19 +437,16 @@ class TestMaintenanceCleanup:
 class TestGameHistory:
     """Tests for GET /admin/games/history endpoint."""
 
-    def test_list_game_history(self, client, admin_auth, sample_game):
+    def test_list_game_history(self, game_history_snapshot):
         """Test listing game history."""
-        response = client.get("/api/v1/admin/games/history", headers=admin_auth)
-        assert response.status_code == 200
-
-        history = response.json()
+        history = game_history_snapshot
         assert isinstance(history, list)
         assert len(history) >= 1
 
-    def test_list_game_history_structure(self, client, admin_auth, sample_game):
+    @pytest.mark.smoke
+    def test_list_game_history_structure(self, game_history_snapshot):
         """Test game history item structure."""
-        response = client.get("/api/v1/admin/games/history", headers=admin_auth)
-        history = response.json()
+        history = game_history_snapshot
 
         for item in history:
             assert "game_id" in item
@@ -421,21 +459,26 @@ class TestGameHistory:
             assert "last_activity_at" in item
             assert "player_names" in item
 
-    def test_list_game_history_pagination(self, client, admin_auth):
+    @pytest.mark.asyncio
+    async def test_list_game_history_pagination(self, admin_auth):
         """Test game history pagination."""
-        # Create multiple games
-        for i in range(3):
-            client.post("/api/v1/game/create", json={"mode": "28", "seats": 4})
-
-        # Test with limit
-        response = client.get("/api/v1/admin/games/history?limit=2", headers=admin_auth)
-        history = response.json()
-        assert len(history) <= 2
-
-        # Test with offset
-        response = client.get("/api/v1/admin/games/history?limit=1&offset=1", headers=admin_auth)
-        history = response.json()
-        assert len(history) <= 1
+        # Seed rows directly: only the endpoint's LIMIT/OFFSET is under test
+        await _seed_games(3)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as async_client:
+            # Test with limit
+            response = await async_client.get("/api/v1/admin/games/history?limit=2", headers=admin_auth)
+            history = response.json()
+            assert len(history) == 2
+
+            # Test with offset
+            response = await async_client.get(
+                "/api/v1/admin/games/history?limit=1&offset=1", headers=admin_auth
+            )
+            history = response.json()
+            assert len(history) == 1
 
     def test_list_game_history_ordered(self, client, admin_auth):
         """Test that games are ordered by last_activity_at descending."""
@@ -453,9 +496,10 @@ class TestGameHistory:
 class TestGameRounds:
     """Tests for GET /admin/games/{game_id}/rounds endpoint."""
 
-    def test_get_game_rounds_success(self, client, admin_auth, sample_game):
-        """Test getting game rounds."""
-        response = client.get(f"/api/v1/admin/games/{sample_game}/rounds", headers=admin_auth)
+    @pytest.mark.smoke
+    def test_game_rounds_comprehensive(self, client, admin_auth, readonly_sample_game):
+        """Test game rounds structure and players from one response."""
+        response = client.get(f"/api/v1/admin/games/{readonly_sample_game}/rounds", headers=admin_auth)
         assert response.status_code == 200
 
         data = response.json()
@@ -468,17 +512,7 @@ class TestGameRounds:
         assert "rounds" in data
         assert "total_rounds" in data
 
-        assert data["game_id"] == sample_game
-
-    def test_get_game_rounds_not_found(self, client, admin_auth):
-        """Test getting rounds for non-existent game."""
-        response = client.get("/api/v1/admin/games/nonexistent-game/rounds", headers=admin_auth)
-        assert response.status_code == 404
-
-    def test_get_game_rounds_players(self, client, admin_auth, sample_game):
-        """Test that players are included in response."""
-        response = client.get(f"/api/v1/admin/games/{sample_game}/rounds", headers=admin_auth)
-        data = response.json()
+        assert data["game_id"] == readonly_sample_game
 
         # Should have 2 players from fixture
         assert len(data["players"]) == 2
@@ -490,6 +524,11 @@ class TestGameRounds:
             assert "is_bot" in player
             assert "joined_at" in player
 
+    def test_get_game_rounds_not_found(self, client, admin_auth):
+        """Test getting rounds for non-existent game."""
+        response = client.get("/api/v1/admin/games/nonexistent-game/rounds", headers=admin_auth)
+        assert response.status_code == 404
+
 
 class TestAdminErrorHandling:
     """Tests for error handling in admin endpoints."""
@@ -500,53 +539,58 @@ class TestAdminErrorHandling:
         response = client.get("/api/v1/admin/sessions/'; DROP TABLE games;--/detail", headers=admin_auth)
         assert response.status_code == 404
 
-    def test_concurrent_admin_requests(self, client, admin_auth, sample_game):
+    @pytest.mark.asyncio
+    async def test_concurrent_admin_requests(self, admin_auth, readonly_sample_game):
         """Test handling multiple concurrent admin requests."""
-        # Make multiple requests in sequence (simulating concurrent access)
-        responses = []
-        for _ in range(5):
-            r = client.get("/api/v1/admin/health", headers=admin_auth)
-            responses.append(r)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as async_client:
+            responses = await asyncio.gather(
+                *[async_client.get("/api/v1/admin/health", headers=admin_auth) for _ in range(5)]
+            )
 
         # All should succeed
         for r in responses:
             assert r.status_code == 200
+            assert r.json()["database_connected"] is True
 
 
 class TestAdminEndToEnd:
     """End-to-end integration tests for admin workflows."""
 
-    def test_full_admin_workflow(self, client, admin_auth):
+    @pytest.mark.asyncio
+    async def test_full_admin_workflow(self, admin_auth):
         """Test complete admin workflow."""
-        # 1. Check health
-        response = client.get("/api/v1/admin/health", headers=admin_auth)
-        assert response.status_code == 200
-
-        # 2. Create a game
-        response = client.post("/api/v1/game/create", json={"mode": "28", "seats": 4})
-        game_id = response.json()["game_id"]
-
-        # 3. Check it appears in sessions
-        response = client.get("/api/v1/admin/sessions", headers=admin_auth)
-        sessions = response.json()
-        assert any(s["game_id"] == game_id for s in sessions)
-
-        # 4. Get session detail
-        response = client.get(f"/api/v1/admin/sessions/{game_id}/detail", headers=admin_auth)
-        assert response.status_code == 200
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as async_client:
+            # 1. Create a game
+            response = await async_client.post("/api/v1/game/create", json={"mode": "28", "seats": 4})
+            game_id = response.json()["game_id"]
+
+            # 2. Read health, sessions and session detail together: they don't
+            # depend on each other, and only health touches the database
+            # (each test has a single connection, so DB reads can't overlap)
+            health, sessions, detail = await asyncio.gather(
+                async_client.get("/api/v1/admin/health", headers=admin_auth),
+                async_client.get("/api/v1/admin/sessions", headers=admin_auth),
+                async_client.get(f"/api/v1/admin/sessions/{game_id}/detail", headers=admin_auth),
+            )
+            assert health.status_code == 200
+            assert any(s["game_id"] == game_id for s in sessions.json())
+            assert detail.status_code == 200
 
-        # 5. Force save
-        response = client.post(f"/api/v1/admin/sessions/{game_id}/save", headers=admin_auth)
-        assert response.status_code == 200
+            # 3. Check database stats
+            response = await async_client.get("/api/v1/admin/database/stats", headers=admin_auth)
+            assert response.json()["total_games"] >= 1
 
-        # 6. Check database stats
-        response = client.get("/api/v1/admin/database/stats", headers=admin_auth)
-        stats = response.json()
-        assert stats["total_games"] >= 1
+            # 4. Force save
+            response = await async_client.post(f"/api/v1/admin/sessions/{game_id}/save", headers=admin_auth)
+            assert response.status_code == 200
 
-        # 7. Delete session
-        response = client.delete(f"/api/v1/admin/sessions/{game_id}", headers=admin_auth)
-        assert response.status_code == 200
+            # 5. Delete session
+            response = await async_client.delete(f"/api/v1/admin/sessions/{game_id}", headers=admin_auth)
+            assert response.status_code == 200
 
     def test_monitor_active_game(self, client, admin_auth):
         """Test monitoring an active game through admin endpoints."""
@@ -112,3 +112,27 @@ async def test_all_pass_redeal_nonblocking():
     assert all(
         len(h) == expected_size for h in sess.hands
     ), "wrong hand sizes after redeal"
+
+
+def test_bids_received_mask_round_trip():
+    from app.game.bidding_manager import BiddingManager
+
+    bm = BiddingManager(4)
+    bm.place_bid(3, 16)
+    bm.place_bid(1, None)
+    assert bm.get_bids_received() == [1, 3]
+    assert not bm.is_complete()
+
+    restored = BiddingManager(4)
+    restored.restore_from_state(
+        bids=dict(bm.bids),
+        bids_received=bm.get_bids_received(),
+        current_highest=bm.current_highest,
+        bid_winner=bm.bid_winner,
+        bid_value=bm.bid_value,
+    )
+    assert restored.bids_received_mask == bm.bids_received_mask
+    restored.place_bid(0, None)
+    restored.place_bid(2, None)
+    assert restored.is_complete()
+    assert not restored.all_passed()
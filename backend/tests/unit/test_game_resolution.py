@@ -19,6 +19,7 @@ import pytest_asyncio
 import uuid
 from typing import Dict
 
+from app.core.game_server import GameServer
 from app.game.session import GameSession
 from app.utils.game_resolution import resolve_game_identifier
 from app.db.config import AsyncSessionLocal
@@ -84,6 +85,24 @@ class TestInMemoryResolution:
             assert resolved_code == game.id
 
 
+    async def test_resolve_short_code_via_server_index(self):
+        """Feature: GameServer keeps a short code index in step with its sessions."""
+        server = GameServer()
+        game = GameSession(mode="28", seats=4, short_code="swift-otter-31")
+        server.add_session(game.id, game)
+        assert server.get_short_code_index() == {"swift-otter-31": game.id}
+
+        resolved = await resolve_game_identifier(
+            "swift-otter-31",
+            server.get_all_sessions(),
+            short_code_index=server.get_short_code_index(),
+        )
+        assert resolved == game.id
+
+        server.remove_session(game.id)
+        assert server.get_short_code_index() == {}
+
+
 @pytest.mark.asyncio
 class TestDatabaseResolution:
     """Test resolution from database when not in memory."""
@@ -124,6 +143,19 @@ class TestDatabaseResolution:
         resolved = await resolve_game_identifier("revival-test-77", sessions)
         assert resolved == game.id
 
+    async def test_resolve_generated_short_code_from_database(self):
+        """Feature: Generated short codes resolve with a single short-code query."""
+        sessions: Dict[str, GameSession] = {}
+
+        game = GameSession(mode="28", seats=4, short_code="brave-tiger-42")
+        async with AsyncSessionLocal() as db:
+            persistence = SessionPersistence(db)
+            await persistence.save_session(game, snapshot_reason="test")
+            await db.commit()
+
+        resolved = await resolve_game_identifier("brave-tiger-42", sessions)
+        assert resolved == game.id
+
     async def test_database_lookup_only_when_not_in_memory(self):
         """Feature: Efficient lookup - avoid DB queries when possible."""
         sessions: Dict[str, GameSession] = {}
@@ -90,3 +90,36 @@ async def test_hidden_trump_reveal_on_first_nonfollow():
     assert ok
     # since ON_FIRST_TRUMP_PLAY, trump should now be revealed
     assert sess.trump_hidden is False
+
+
+@pytest.mark.parametrize(
+    "mode, played, owner, seat, expected",
+    [
+        (HiddenTrumpMode.OPEN_IMMEDIATELY, "♣", 0, 1, True),
+        (HiddenTrumpMode.ON_FIRST_TRUMP_PLAY, "♥", 0, 1, True),
+        (HiddenTrumpMode.ON_FIRST_TRUMP_PLAY, "♦", 0, 1, False),
+        (HiddenTrumpMode.ON_FIRST_NONFOLLOW, "♦", 0, 1, True),
+        (HiddenTrumpMode.ON_BIDDER_NONFOLLOW, "♦", 0, 1, False),
+        (HiddenTrumpMode.ON_BIDDER_NONFOLLOW, "♦", 1, 1, True),
+    ],
+)
+def test_should_reveal_trump_dispatches_per_mode(mode, played, owner, seat, expected):
+    from app.game.hidden_trump import HiddenTrumpManager
+    from app.game.rules import Card
+
+    played_card = Card(suit=played, rank="7", uid=f"7{played}#1")
+    lead = [(0, Card(suit="♠", rank="A", uid="A♠#1"))]
+    hand = [played_card, Card(suit="♠", rank="8", uid="8♠#1")]
+
+    reveal, reason = HiddenTrumpManager.should_reveal_trump(
+        trump_hidden=True,
+        hidden_trump_mode=mode,
+        played_card=played_card,
+        trump_suit="♥",
+        trump_owner_seat=owner,
+        player_seat=seat,
+        current_trick=lead,
+        player_hand=hand,
+    )
+    assert reveal is expected
+    assert (reason is not None) is expected
@@ -4,15 +4,19 @@ Tests for session persistence layer.
 Tests saving, loading, and deleting game sessions from database.
 """
 
+import json
+from typing import Optional
+
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from app.db.persistence import SessionPersistence
-from app.db.repository import GameRepository
+from app.db.repository import GameRepository, RoundHistoryRepository
+from app.game import ai
 from app.game.session import GameSession, HiddenTrumpMode, SessionState
-from app.models import BidCmd, PlayerInfo
+from app.models import BidCmd, ChooseTrumpCmd, PlayCardCmd, PlayerInfo
 
 
 @pytest_asyncio.fixture
@@ -248,3 +252,133 @@ async def test_multiple_snapshots(
     # Most recent should be the last one
     latest = snapshots[0]
     assert latest.snapshot_reason == "after_bid"
+
+
+@pytest.mark.asyncio
+async def test_short_code_exists(db_session: AsyncSession):
+    """Test short code existence check used during code generation."""
+    repo = GameRepository(db_session)
+    assert await repo.short_code_exists("brave-tiger-42") is False
+
+    await repo.create_game(
+        game_id="game-with-code",
+        short_code="brave-tiger-42",
+        mode="28",
+        seats=4,
+        min_bid=14,
+        hidden_trump_mode="on_first_nonfollow",
+        two_decks_for_56=False,
+    )
+
+    assert await repo.short_code_exists("brave-tiger-42") is True
+    assert await repo.short_code_exists("calm-otter-10") is False
+
+
+async def _session_in_play(session: GameSession) -> None:
+    """Deal, bid 16 from seat 3 (others pass) and choose spades, reaching PLAY."""
+    await session.start_round(dealer=0)
+    await session.place_bid(3, BidCmd(value=16))
+    for seat in (2, 1, 0):
+        await session.place_bid(seat, BidCmd(value=None))
+    await session.choose_trump(3, ChooseTrumpCmd(suit="♠"))
+
+
+async def _play_bot_cards(session: GameSession, count: Optional[int] = None) -> None:
+    """Play `count` cards (default: the rest of the round) as the bot would."""
+    played = 0
+    while session.state == SessionState.PLAY and (count is None or played < count):
+        seat = session.turn
+        cmd = session.force_bot_play_choice(seat, ai)
+        ok, msg = await session.play_card(
+            seat, PlayCardCmd(card_id=cmd["payload"]["card_id"])
+        )
+        assert ok, msg
+        played += 1
+
+
+@pytest.mark.asyncio
+async def test_completed_round_saved_to_history(
+    db_session: AsyncSession, sample_session: GameSession
+):
+    """Test that a completed round is recorded and persisted as round history."""
+    await _session_in_play(sample_session)
+    await _play_bot_cards(sample_session)
+
+    assert len(sample_session.rounds_history) == 1
+    record = sample_session.rounds_history[0]
+    assert record.round_number == 1
+    assert sum(record.points_by_seat) == 28
+    assert sample_session.get_public_state().rounds_history[0]["bid_value"] == 16
+
+    persistence = SessionPersistence(db_session)
+    assert await persistence.save_session(sample_session, snapshot_reason="round_end")
+    rounds = await RoundHistoryRepository(db_session).get_rounds_for_game(
+        sample_session.id
+    )
+    assert len(rounds) == 1
+    saved = json.loads(rounds[0].round_data)
+    assert saved["bid_winner"] == 3
+    assert sum(saved["points_by_seat"].values()) == 28
+
+
+@pytest.mark.asyncio
+async def test_restored_session_finishes_round(
+    db_session: AsyncSession, sample_session: GameSession
+):
+    """Test that a session restored mid-play still detects the end of the round."""
+    await _session_in_play(sample_session)
+    await _play_bot_cards(sample_session, count=1)
+
+    persistence = SessionPersistence(db_session)
+    await persistence.save_session(sample_session, snapshot_reason="mid_play")
+    loaded = await persistence.load_session(sample_session.id)
+    assert loaded is not None
+    assert loaded.cards_remaining == sample_session.cards_remaining == 31
+
+    await _play_bot_cards(loaded)
+
+    assert loaded.state == SessionState.SCORING
+    assert loaded.cards_remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_captured_trick_points_survive_restore(
+    db_session: AsyncSession, sample_session: GameSession
+):
+    """Test that captured trick points match before and after a snapshot restore."""
+    await _session_in_play(sample_session)
+    await _play_bot_cards(sample_session, count=8)
+
+    original = sample_session.trick_manager.get_captured_tricks_for_serialization()
+    assert len(original) == 2
+
+    persistence = SessionPersistence(db_session)
+    await persistence.save_session(sample_session, snapshot_reason="two_tricks")
+    loaded = await persistence.load_session(sample_session.id)
+    assert loaded is not None
+    assert loaded.trick_manager.get_captured_tricks_for_serialization() == original
+
+
+@pytest.mark.asyncio
+async def test_round_already_saved_is_not_duplicated(
+    db_session: AsyncSession, sample_session: GameSession
+):
+    """Test that a round saved by a concurrent save does not fail a later one."""
+    await _session_in_play(sample_session)
+    await _play_bot_cards(sample_session)
+    record = sample_session.rounds_history[0]
+
+    repo = RoundHistoryRepository(db_session)
+    persistence = SessionPersistence(db_session)
+    assert await persistence.save_session(sample_session, snapshot_reason="round_end")
+    assert not await repo.save_round(
+        game_id=sample_session.id,
+        round_number=record.round_number,
+        dealer=record.dealer,
+        bid_winner=record.bid_winner,
+        bid_value=record.bid_value,
+        trump=record.trump,
+        round_data=record.to_dict(),
+    )
+    assert await persistence.save_session(sample_session, snapshot_reason="round_end")
+    assert await repo.get_round_count(sample_session.id) == 1
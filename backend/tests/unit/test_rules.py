@@ -16,6 +16,16 @@ def test_shuffle_and_deal():
     assert len(kitty) == 0
 
 
+def test_deal_is_round_robin():
+    d = make_deck("56", two_decks_for_56=True)
+    for seats in (4, 6):
+        hands, kitty = deal(d, seats)
+        total = (len(d) // seats) * seats
+        for i in range(total):
+            assert hands[i % seats][i // seats] is d[i]
+        assert kitty == d[total:]
+
+
 def test_trick_winner_simple():
     # create simple trick: seats 0..3
     c0 = Card("♠", "10", "10♠#1")
@@ -29,3 +39,28 @@ def test_trick_winner_simple():
     # if trump is hearts, play has heart played by seat2 so winner seat2
     w2 = determine_trick_winner(trick, "♥")
     assert w2 == 2
+
+
+def test_card_is_slotted():
+    c = Card("♠", "J", "J♠#1")
+    assert not hasattr(c, "__dict__")
+    assert c == Card("♠", "J", "J♠#1")
+    assert hash(c) == hash(Card("♠", "J", "J♠#1"))
+
+
+def test_card_code_tables_match_rank_and_points():
+    from app.game.rules import (
+        CARD_POINTS,
+        NON_TRUMP_RANK_INDEX,
+        TRUMP_RANK_INDEX,
+        get_rank_value,
+        trick_points,
+    )
+
+    deck = make_deck("28", two_decks_for_56=False)
+    assert len({c.code for c in deck}) == 32
+    for c in deck:
+        assert c.points() == CARD_POINTS[c.rank]
+        assert get_rank_value(c, True) == TRUMP_RANK_INDEX[c.rank]
+        assert get_rank_value(c, False) == NON_TRUMP_RANK_INDEX[c.rank]
+    assert trick_points([(i % 4, c) for i, c in enumerate(deck)]) == 28
@@ -1,7 +1,18 @@
 # backend/tests/test_session.py
 import pytest
+import pytest_asyncio
 from app.game.session import GameSession
-from app.models import BidCmd, ChooseTrumpCmd, PlayCardCmd, PlayerInfo
+from app.models import BidCmd, ChooseTrumpCmd, GameStateDTO, PlayCardCmd, PlayerInfo
+
+
+@pytest_asyncio.fixture
+async def started_session():
+    """A 4-player 28-mode session with the first round dealt (dealer 0)."""
+    sess = GameSession(mode="28", seats=4)
+    for i in range(4):
+        await sess.add_player(PlayerInfo(player_id=f"p{i}", name=f"bot{i}"))
+    await sess.start_round(dealer=0)
+    return sess
 
 
 @pytest.mark.asyncio
@@ -42,3 +53,56 @@ async def test_start_and_basic_flow():
     card = sess.hands[leader][0]
     ok3, m3 = await sess.play_card(leader, PlayCardCmd(card_id=card.uid))
     assert ok3
+
+
+@pytest.mark.asyncio
+async def test_player_has_suit_tracks_hand_changes(started_session):
+    sess = started_session
+
+    for seat in range(4):
+        for suit in ("♠", "♥", "♦", "♣"):
+            expected = any(c.suit == suit for c in sess.hands[seat])
+            assert sess._player_has_suit(seat, suit) == expected
+
+    # Replacing or shrinking a hand outside play_card must not leave a stale mask
+    sess.hands[0] = [c for c in sess.hands[0] if c.suit != "♣"]
+    assert not sess._player_has_suit(0, "♣")
+    for card in [c for c in sess.hands[1] if c.suit == "♠"]:
+        sess.hands[1].remove(card)
+    assert not sess._player_has_suit(1, "♠")
+
+
+@pytest.mark.asyncio
+async def test_public_state_is_cached_until_mutation(started_session):
+    sess = started_session
+
+    first = sess.get_public_state()
+    first_dict = sess.get_public_state_dict()
+    assert sess.get_public_state() is first
+    assert sess.get_public_state_dict() is first_dict
+    assert first_dict == first.model_dump()
+
+    ok, _ = await sess.place_bid(3, BidCmd(value=16))
+    assert ok
+    second = sess.get_public_state()
+    second_dict = sess.get_public_state_dict()
+    assert second is not first
+    assert second_dict is not first_dict
+    assert second.bids[3] == 16
+    assert second_dict["bids"][3] == 16
+
+
+@pytest.mark.asyncio
+async def test_public_state_matches_validated_dto(started_session):
+    sess = started_session
+    await sess.place_bid(3, BidCmd(value=16))
+    for seat in (2, 1, 0):
+        await sess.place_bid(seat, BidCmd(value=None))
+    await sess.choose_trump(3, ChooseTrumpCmd(suit="♠"))
+    leader = sess.leader
+    ok, _ = await sess.play_card(leader, PlayCardCmd(card_id=sess.hands[leader][0].uid))
+    assert ok
+
+    dumped = sess.get_public_state().model_dump()
+    assert dumped["current_trick"][leader]["id"]
+    assert GameStateDTO(**dumped).model_dump() == dumped
@@ -78,20 +78,12 @@ class TestGenerateShortCode:
 
     def test_fallback_to_uuid(self, monkeypatch):
         """Test fallback to UUID when can't generate unique code."""
-        # Create a set with all possible combinations (mock scenario)
-        # We'll mock random.choice to always return same values
-        call_count = [0]
+        # Mock the random draw to always decode to the same code
+        def mock_randrange(stop):
+            # Index 0 decodes to the first adjective, first noun and number 10
+            return 0
 
-        def mock_choice(items):
-            # Always return first item
-            return items[0]
-
-        def mock_randint(a, b):
-            # Always return same number
-            return 10
-
-        monkeypatch.setattr("app.utils.shortcode.random.choice", mock_choice)
-        monkeypatch.setattr("app.utils.shortcode.random.randint", mock_randint)
+        monkeypatch.setattr("app.utils.shortcode.random.randrange", mock_randrange)
 
         # Create existing set with the code that will be generated
         existing = {f"{ADJECTIVES[0]}-{NOUNS[0]}-10"}